@@ -1,19 +1,94 @@
 import secrets
+import random
 import string
 import argparse
-import pyperclip
 import json
 import re
+import csv
+import io
+import math
+import operator
+import struct
+import shutil
 import hashlib
 import sys
 import os
-import getpass
+import time
+import atexit
+import base64
+import sqlite3
+import threading
+import weakref
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple, Set
-from dataclasses import dataclass, asdict, field
+from typing import List, Dict, FrozenSet, Optional, Tuple, Set
+from dataclasses import dataclass, asdict, field, fields, is_dataclass
 from enum import Enum, auto
 from collections import defaultdict
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# cryptography es opcional: solo hace falta para cifrar exportaciones
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+    from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+    CRYPTO_AVAILABLE = True
+except ImportError:
+    Fernet = InvalidToken = hashes = PBKDF2HMAC = Scrypt = None
+    CRYPTO_AVAILABLE = False
+
+# requests es opcional: solo hace falta para consultar la API de HIBP
+try:
+    import requests
+    from requests.adapters import HTTPAdapter, Retry
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    requests = HTTPAdapter = Retry = None
+    REQUESTS_AVAILABLE = False
+
+# ijson es opcional: permite cargar bóvedas grandes entrada a entrada
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    ijson = None
+    IJSON_AVAILABLE = False
+
+# Errores de lectura de los archivos JSON, incluidos los de ijson si está disponible
+_JSON_LOAD_ERRORS = (json.JSONDecodeError, IOError) + (
+    (ijson.JSONError,) if ijson is not None else ()
+)
+
+# Tamaño (bytes) a partir del cual los archivos JSON se cargan en streaming con ijson
+STREAM_LOAD_MIN_SIZE = 1_000_000
+
+# Cabecera de las exportaciones cifradas con clave derivada por scrypt; los
+# archivos sin ella son exportaciones antiguas con PBKDF2 ("sal::datos")
+_SCRYPT_HEADER = b'scrypt\0'
+_EXPORT_SALT_LENGTH = 16
+
+# orjson es opcional: si está instalado se usa para (de)serializar las
+# contraseñas y el historial
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# pyperclip se importa la primera vez que se copia algo al portapapeles, para no
+# pagar su carga en cada arranque del programa
+_pyperclip = None
+
+def _copy_to_clipboard(text: str):
+    """Copia `text` al portapapeles importando pyperclip solo cuando hace falta."""
+    global _pyperclip
+    if _pyperclip is None:
+        import pyperclip
+        _pyperclip = pyperclip
+    _pyperclip.copy(text)
 
 # Local wordlist for passphrase generation
 WORDS_ES = [
@@ -32,6 +107,263 @@
     'comet', 'meteor', 'season', 'spring', 'summer', 'autumn', 'winter', 'orange', 'grape', 'strawberry'
 ]
 
+def _draw_size(missing: int, accepted: int, total: int) -> int:
+    """
+    Número de muestras a extraer para obtener `missing` valores aceptados
+    cuando se aceptan `accepted` de cada `total`: el valor esperado más un
+    pequeño margen, para que casi nunca haga falta una segunda llamada.
+    """
+    return -(-missing * total // accepted) + 8
+
+def _random_below(n: int, count: int, randbytes=os.urandom) -> List[int]:
+    """
+    Devuelve `count` enteros uniformes en [0, n) a partir de un único bloque de
+    os.urandom, usando muestreo por rechazo para evitar el sesgo del módulo.
+    """
+    result: List[int] = []
+    if n <= 256:
+        # Ruta rápida de un byte: se acepta todo byte por debajo del mayor
+        # múltiplo de n y se reduce con módulo, sin conversiones intermedias
+        limit = 256 - 256 % n
+        while len(result) < count:
+            missing = count - len(result)
+            draw = randbytes(_draw_size(missing, limit, 256))
+            result.extend(b % n for b in draw if b < limit)
+        del result[count:]
+        return result
+
+    bits = (n - 1).bit_length()
+    mask = (1 << bits) - 1
+    width = (bits + 7) // 8
+    while len(result) < count:
+        buf = randbytes(_draw_size(count - len(result), n, mask + 1) * width)
+        for i in range(0, len(buf), width):
+            value = int.from_bytes(buf[i:i + width], 'little') & mask
+            if value < n:
+                result.append(value)
+                if len(result) == count:
+                    break
+    return result
+
+# Tablas de traducción por alfabeto: (byte -> carácter, bytes a descartar,
+# número de bytes aceptados de cada 256)
+_TRANSLATE_TABLES: Dict[str, Tuple[bytes, bytes, int]] = {}
+
+def _random_bytes(alphabet: str, count: int, randbytes=os.urandom) -> bytes:
+    """
+    Devuelve `count` caracteres uniformes de un alfabeto ASCII (hasta 256
+    símbolos), codificados en ASCII. Un solo bytes.translate descarta los bytes
+    por encima del mayor múltiplo del tamaño del alfabeto y convierte el resto
+    en caracteres.
+    """
+    tables = _TRANSLATE_TABLES.get(alphabet)
+    if tables is None:
+        n = len(alphabet)
+        limit = 256 - 256 % n
+        table = (alphabet * (256 // n + 1))[:256].encode('ascii')
+        tables = _TRANSLATE_TABLES[alphabet] = (table, bytes(range(limit, 256)), limit)
+    table, rejected, limit = tables
+    out = b''
+    while len(out) < count:
+        draw = randbytes(_draw_size(count - len(out), limit, 256))
+        out += draw.translate(table, rejected)
+    return out[:count]
+
+def _random_string(alphabet: str, count: int, randbytes=os.urandom) -> str:
+    """Como _random_bytes, pero devuelve el resultado como str."""
+    return _random_bytes(alphabet, count, randbytes).decode('ascii')
+
+# PRNG de espacio de usuario para el modo --fast; se siembra una sola vez
+# desde os.urandom la primera vez que se usa
+_FAST_RNG: Optional[random.Random] = None
+
+def _fast_rng() -> random.Random:
+    """
+    Devuelve el PRNG del modo --fast. Es el Mersenne Twister de la biblioteca
+    estándar (random.Random) y no PCG64 de NumPy, que no es una dependencia
+    del proyecto.
+    """
+    global _FAST_RNG
+    if _FAST_RNG is None:
+        _FAST_RNG = random.Random(int.from_bytes(os.urandom(16), 'little'))
+    return _FAST_RNG
+
+def _fast_randbytes(size: int) -> bytes:
+    """Equivalente no criptográfico de os.urandom (solo para el modo --fast)."""
+    return _fast_rng().getrandbits(size * 8).to_bytes(size, 'little')
+
+def _sha1_upper(password: str) -> str:
+    """Hash SHA-1 de la contraseña en hexadecimal y mayúsculas (formato de HIBP)."""
+    return hashlib.sha1(password.encode('utf-8')).hexdigest().upper()
+
+# Evaluador de fortaleza de cada proceso del pool de check_strength_batch
+_strength_worker: Optional['PasswordGenerator'] = None
+
+def _init_strength_worker(state):
+    """Inicializa el evaluador de fortaleza del proceso con el estado del generador."""
+    global _strength_worker
+    _strength_worker = PasswordGenerator._strength_checker(state)
+
+def _strength_worker_check(password: str) -> 'PasswordStrength':
+    """Evalúa una contraseña en un proceso del ProcessPoolExecutor."""
+    worker = _strength_worker
+    if worker is None:
+        raise RuntimeError("El proceso no se inicializó con _init_strength_worker")
+    return worker.check_strength(password)[0]
+
+_LOG2 = math.log2
+
+def _atomic_write(path: Path, data: bytes):
+    """
+    Escribe `data` en un archivo temporal (permisos 0600) con llamadas directas a
+    os.write, lo sincroniza en disco y lo mueve sobre `path` con os.replace, de
+    modo que un corte a mitad de escritura nunca deja el archivo a medias.
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(tmp_path, flags, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+def _read_sequential(path) -> bytes:
+    """
+    Lee un archivo completo. En los archivos grandes avisa antes al kernel de que
+    se va a leer entero y en orden (posix_fadvise), para que la lectura anticipada
+    del disco se solape con el análisis en lugar de bloquearlo en cada página.
+    """
+    with open(path, 'rb') as f:
+        if sys.platform != 'win32' and hasattr(os, 'posix_fadvise'):
+            size = os.fstat(f.fileno()).st_size
+            if size > STREAM_LOAD_MIN_SIZE:
+                os.posix_fadvise(f.fileno(), 0, size, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(f.fileno(), 0, size, os.POSIX_FADV_WILLNEED)
+        return f.read()
+
+@lru_cache(maxsize=64)
+def _precompute_alphabet(
+    classes: Tuple[str, str, str, str], mask: int
+) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Devuelve el alfabeto combinado y los conjuntos obligatorios para una máscara
+    de tipos (bits: 1=minúsculas, 2=mayúsculas, 4=dígitos, 8=símbolos). Solo
+    hay 15 combinaciones por juego de conjuntos, así que cada una se calcula
+    una única vez. Los caracteres repetidos se eliminan (conservando el orden)
+    para que no sesguen la distribución ni aumenten la tasa de rechazo.
+    """
+    required = tuple(''.join(dict.fromkeys(part))
+                     for bit, part in zip((1, 2, 4, 8), classes) if mask & bit)
+    return ''.join(dict.fromkeys(''.join(required))), required
+
+# Generador criptográfico compartido para selecciones en bloque
+_SYSRAND = secrets.SystemRandom()
+
+# Prefijo ISO del último segundo formateado: (segundo_epoch, 'YYYY-MM-DDTHH:MM:SS')
+_iso_second_cache: Tuple[int, str] = (-1, '')
+
+def _now_iso() -> str:
+    """
+    Devuelve la hora local actual en formato ISO 8601 con microsegundos, sin
+    crear objetos datetime y reutilizando el prefijo del segundo en curso.
+    """
+    global _iso_second_cache
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    if _iso_second_cache[0] != seconds:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(seconds))
+        _iso_second_cache = (seconds, prefix)
+    return f"{_iso_second_cache[1]}.{micros:06d}"
+
+# Símbolos admitidos en las contraseñas generadas
+_SYMBOLS = '!@#$%^&*()_+-=[]{}|;:,.<>?'
+_SYMBOL_SET = frozenset(_SYMBOLS)
+
+# Contraseñas más comunes (se comparan en minúsculas)
+_COMMON_PASSWORDS = frozenset({
+    'password', '123456', '12345678', '1234', 'qwerty', '12345',
+    'dragon', 'baseball', 'football', 'letmein', 'monkey',
+    'mustang', 'michael', 'shadow', 'master', 'jennifer',
+    '111111', '2000', 'jordan', 'superman', 'harley', '1234567'
+})
+
+def _classify_byte(b: int) -> int:
+    """Clase de un byte ASCII: 1=minúscula, 2=mayúscula, 4=dígito, 8=símbolo."""
+    c = chr(b)
+    if c in string.ascii_lowercase:
+        return 1
+    if c in string.ascii_uppercase:
+        return 2
+    if c in string.digits:
+        return 4
+    if c in _SYMBOLS:
+        return 8
+    return 0
+
+# Tabla de 256 entradas para clasificar cada byte con un solo acceso indexado
+_CLASS_TABLE = bytes(_classify_byte(b) for b in range(256))
+
+class _BloomFilter:
+    """
+    Filtro de Bloom sobre un bytearray para comprobar la pertenencia a listas muy
+    grandes de contraseñas comunes (p. ej. las de SecLists) con una fracción de
+    la memoria que ocuparía un set. Se guarda en un formato binario propio
+    (cabecera + bits), por lo que cargarlo nunca ejecuta código.
+    """
+    MAGIC = b'PGBLOOM1'
+    HEADER = struct.Struct('<8sQB')
+
+    def __init__(self, num_bits: int, num_hashes: int,
+                 bits: Optional[bytearray] = None):
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bits if bits is not None else bytearray((num_bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float) -> '_BloomFilter':
+        """
+        Crea un filtro vacío dimensionado para `capacity` elementos y la tasa
+        de falsos positivos dada.
+        """
+        capacity = max(1, capacity)
+        num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        return cls(num_bits, num_hashes)
+
+    def _positions(self, item: str):
+        # Doble hash (Kirsch-Mitzenmacher) a partir de un único BLAKE2b de 128 bits
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        num_bits = self.num_bits
+        return ((h1 + i * h2) % num_bits for i in range(self.num_hashes))
+
+    def add(self, item: str):
+        bits = self.bits
+        for pos in self._positions(item):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def save(self, path: Path):
+        header = self.HEADER.pack(self.MAGIC, self.num_bits, self.num_hashes)
+        _atomic_write(path, header + bytes(self.bits))
+
+    @classmethod
+    def load(cls, path: Path) -> '_BloomFilter':
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, num_bits, num_hashes = cls.HEADER.unpack_from(data)
+        bits = bytearray(data[cls.HEADER.size:])
+        if magic != cls.MAGIC or len(bits) != (num_bits + 7) // 8:
+            raise ValueError("archivo de filtro de Bloom no válido")
+        return cls(num_bits, num_hashes, bits)
+
 class PasswordStrength(Enum):
     VERY_WEAK = 0
     WEAK = 1
@@ -40,32 +372,143 @@ class PasswordStrength(Enum):
     VERY_STRONG = 4
     EXCELLENT = 5
 
+def _with_slots(*extra: str):
+    """
+    Recrea una dataclass con __slots__ para sus campos y los atributos `extra`,
+    como hace dataclass(slots=True), que solo existe desde Python 3.10. Las
+    instancias no llevan __dict__, lo que reduce la memoria de cada entrada.
+    Igual que dataclass(slots=True), añade __getstate__/__setstate__ para que
+    las instancias se puedan serializar con pickle en cualquier protocolo.
+    """
+    def wrap(cls):
+        names = tuple(f.name for f in fields(cls)) + extra
+        cls_dict = {key: value for key, value in cls.__dict__.items()
+                    if key not in names and key not in ('__dict__', '__weakref__')}
+        cls_dict['__slots__'] = names
+        
+        def __getstate__(self):
+            return [getattr(self, name) for name in names]
+        
+        def __setstate__(self, state):
+            for name, value in zip(names, state):
+                object.__setattr__(self, name, value)
+        
+        cls_dict.setdefault('__getstate__', __getstate__)
+        cls_dict.setdefault('__setstate__', __setstate__)
+        return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    return wrap
+
+# Cabecera de los CSV que escribe export_passwords
+_CSV_EXPORT_HEADER = ['service', 'username', 'password', 'created_at', 'updated_at',
+                      'strength']
+
+# Texto con el que export_passwords escribe cada fortaleza ('PasswordStrength.X').
+# Solo se acepta en CSV con la cabecera de exportación; en cualquier otro archivo la
+# columna 'strength' puede seguir otra escala y la fortaleza se recalcula
+_STRENGTH_LABELS: Dict[str, PasswordStrength] = {
+    str(_strength): _strength for _strength in PasswordStrength
+}
+
+@_with_slots('_created_at_cache')
 @dataclass
 class PasswordEntry:
     service: str
     password: str
     username: str = ""
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
+    updated_at: str = field(default_factory=_now_iso)
     expires_in_days: Optional[int] = 90
     notes: str = ""
     tags: List[str] = field(default_factory=list)
     strength: Optional[PasswordStrength] = None
     is_compromised: bool = False
 
+    def __post_init__(self):
+        # Las entradas serializadas guardan la fortaleza como su valor entero
+        if isinstance(self.strength, int):
+            self.strength = PasswordStrength(self.strength)
+        # Caché (texto, datetime) de created_at; no es un campo, así que no se serializa
+        self._created_at_cache: Tuple[str, Optional[datetime]] = ('', None)
+
+    @property
+    def created_at_dt(self) -> datetime:
+        """created_at como datetime, analizado solo cuando cambia el texto."""
+        text, parsed = self._created_at_cache
+        if parsed is None or text != self.created_at:
+            parsed = datetime.fromisoformat(self.created_at)
+            self._created_at_cache = (self.created_at, parsed)
+        return parsed
+
+def _json_default(obj):
+    """
+    Serializa los valores Enum (p. ej. PasswordStrength) como su valor y las
+    dataclasses (p. ej. PasswordEntry) como diccionarios.
+    """
+    if isinstance(obj, Enum):
+        return obj.value
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Objeto de tipo {type(obj).__name__} no serializable a JSON")
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """Serializa a JSON en UTF-8, con orjson si está disponible."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None,
+                      default=_json_default).encode('utf-8')
+
+# orjson.JSONDecodeError hereda de json.JSONDecodeError, así que los
+# manejadores de errores existentes sirven para ambos
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Gestores abiertos con un registro de operaciones que volcar al terminar el
+# proceso; las referencias débiles no los mantienen vivos hasta entonces
+_OPEN_VAULTS: 'weakref.WeakSet[PasswordGenerator]' = weakref.WeakSet()
+
+@atexit.register
+def _compact_open_vaults():
+    """Vuelca a los archivos JSON el registro de los gestores aún abiertos."""
+    for vault in list(_OPEN_VAULTS):
+        vault._compact_wal()
+
 class PasswordGenerator:
+    # Listas de palabras memorizadas por idioma (compartidas entre instancias)
+    _WORDLISTS: Dict[Tuple[str, bool], Tuple[str, ...]] = {}
+    
+    # Tamaño (bytes) a partir del cual el registro de operaciones se compacta
+    WAL_COMPACT_SIZE = 1024 * 1024
+    
+    # Versiones anteriores de cada contraseña que se conservan en el historial
+    HISTORY_LIMIT = 5
+    
+    # Número de contraseñas a partir del cual los hashes SHA-1 se calculan en paralelo
+    HIBP_PARALLEL_HASH_MIN = 4096
+    
+    # Número de contraseñas distintas a partir del cual la fortaleza de un lote
+    # se evalúa en varios procesos
+    STRENGTH_PARALLEL_MIN = 50_000
+    
+    # Vigencia (segundos) de los rangos de HIBP guardados en la caché local
+    HIBP_CACHE_TTL = 7 * 24 * 60 * 60
+
     def __init__(self, data_dir: Optional[Path] = None):
         self.char_sets = {
             'lowercase': string.ascii_lowercase,
             'uppercase': string.ascii_uppercase,
             'digits': string.digits,
-            'symbols': '!@#$%^&*()_+-=[]{}|;:,.<>?',
+            'symbols': _SYMBOLS,
             'special': '!@#$%^&*()_+-=[]{}|;:,.<>?',
             'brackets': '[]{}()<>',
             'punctuation': '!?.,;:',
             'math': '+=-*/><^',
             'space': ' '
         }
+        self._symbol_set = _SYMBOL_SET
+        
+        # Conjuntos de cada tipo (minúsculas, mayúsculas, dígitos, símbolos); los
+        # alfabetos combinados se construyen bajo demanda con _precompute_alphabet
+        self._classes = tuple(self.char_sets[k]
+                              for k in ('lowercase', 'uppercase', 'digits', 'symbols'))
         
         # Set up data directory
         self.data_dir = data_dir or Path.home() / '.password_generator'
@@ -73,14 +516,38 @@ def __init__(self, data_dir: Optional[Path] = None):
         
         # Initialize database paths
         self.passwords_file = self.data_dir / 'passwords.json'
+        # Registro de solo anexado (una operación JSON por línea) con los cambios
+        # posteriores al último guardado completo de passwords.json/history.json
+        self.wal_file = self.data_dir / 'passwords.wal'
+        self._wal = None
         self.history_file = self.data_dir / 'history.json'
         self.config_file = self.data_dir / 'config.json'
+        # Filtro de Bloom opcional con una lista grande de contraseñas comunes
+        # (ver build_common_password_filter); se carga la primera vez que se usa
+        self.common_filter_file = self.data_dir / 'common_passwords.bloom'
+        self._common_filter: Optional[_BloomFilter] = None
+        self._common_filter_loaded = False
         
         # Load data
         self.passwords: Dict[str, PasswordEntry] = self._load_passwords()
         self.history = self._load_history()
+        self._replay_wal()
+        self._rebuild_dupe_index()
         self.config = self._load_config()
         
+        # Sesión HTTP compartida y rangos de HIBP ya consultados
+        # (prefijo -> {sufijo: apariciones})
+        self._hibp_session = None
+        self._hibp_cache: Dict[str, Dict[str, int]] = {}
+        # Caché persistente de rangos de HIBP (se abre la primera vez que se usa)
+        self.hibp_cache_file = self.data_dir / 'hibp_cache.db'
+        self._hibp_db: Optional[sqlite3.Connection] = None
+        # Protege la creación de la sesión y el acceso a la caché desde varios hilos
+        self._hibp_lock = threading.Lock()
+        
+        # Volcar los cambios pendientes del registro al terminar el proceso
+        _OPEN_VAULTS.add(self)
+        
         # Check for compromised passwords on startup
         self._check_compromised_passwords()
 
@@ -88,20 +555,59 @@ def _load_passwords(self) -> Dict[str, PasswordEntry]:
         """Carga las contraseñas guardadas desde el archivo JSON."""
         if self.passwords_file.exists():
             try:
-                with open(self.passwords_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return {k: PasswordEntry(**v) for k, v in data.items()}
-            except (json.JSONDecodeError, IOError) as e:
+                with open(self.passwords_file, 'rb') as f:
+                    if ijson is not None and self._should_stream(self.passwords_file):
+                        # Materializar una entrada cada vez, no el documento entero
+                        return {k: PasswordEntry(**v) for k, v in ijson.kvitems(f, '')}
+                    data = _json_loads(f.read())
+                return {k: PasswordEntry(**v) for k, v in data.items()}
+            except _JSON_LOAD_ERRORS as e:
                 print(f"Error al cargar las contraseñas: {e}")
         return {}
     
+    @staticmethod
+    def _should_stream(path: Path) -> bool:
+        """
+        Indica si el archivo es lo bastante grande para cargarlo en streaming
+        (con ijson, si está instalado).
+        """
+        return path.stat().st_size > STREAM_LOAD_MIN_SIZE
+    
+    def _replay_wal(self):
+        """
+        Reaplica, en orden, las operaciones registradas tras el último guardado
+        completo.
+        """
+        if not self.wal_file.exists():
+            return
+        try:
+            with open(self.wal_file, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = _json_loads(line)
+                    if record['op'] == 'upsert':
+                        service = record['service']
+                        self.passwords[service] = PasswordEntry(**record['entry'])
+                        item = record.get('history_item')
+                        if item is not None:
+                            history = self.history.setdefault(service, [])
+                            history.append(item)
+                            del history[:-self.HISTORY_LIMIT]
+        except (json.JSONDecodeError, IOError, KeyError, TypeError) as e:
+            # Una línea incompleta (p. ej. por un corte durante la escritura)
+            # solo descarta lo que viene detrás de ella
+            print(f"Error al cargar el registro de contraseñas: {e}")
+    
     def _load_history(self) -> Dict[str, List[Dict]]:
         """Carga el historial de contraseñas."""
         if self.history_file.exists():
             try:
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
+                with open(self.history_file, 'rb') as f:
+                    if ijson is not None and self._should_stream(self.history_file):
+                        return dict(ijson.kvitems(f, ''))
+                    return _json_loads(f.read())
+            except _JSON_LOAD_ERRORS:
                 pass
         return {}
     
@@ -140,18 +646,69 @@ def save_config(self):
             print(f"Error al guardar la configuración: {e}")
     
     def save_passwords(self):
-        """Guarda las contraseñas en el archivo JSON."""
+        """
+        Guarda las contraseñas y el historial completos en sus archivos JSON y
+        vacía el registro de operaciones, que ya queda incluido en ellos.
+        """
         try:
             # Create backup if enabled
             if self.config.get('backup_enabled', True):
                 self._create_backup()
                 
-            with open(self.passwords_file, 'w', encoding='utf-8') as f:
-                serialized = {k: asdict(v) for k, v in self.passwords.items()}
-                json.dump(serialized, f, ensure_ascii=False, indent=2)
+            # Construir el contenido completo en memoria y sustituir cada archivo de
+            # forma atómica; las copias de seguridad enlazadas al archivo anterior
+            # no se modifican
+            _atomic_write(self.passwords_file, _json_dumps(self.passwords, indent=True))
+            _atomic_write(self.history_file, _json_dumps(self.history, indent=True))
+            
+            if self._wal is not None:
+                self._wal.close()
+                self._wal = None
+            if self.wal_file.exists():
+                self.wal_file.unlink()
         except IOError as e:
             print(f"Error al guardar las contraseñas: {e}")
     
+    def _append_wal(self, service: str, entry: PasswordEntry,
+                    history_item: Optional[Dict] = None):
+        """
+        Anexa la entrada (y, si la hay, la versión anterior que pasó al
+        historial) al registro de operaciones sin reescribir el resto de
+        contraseñas, de modo que cada guardado cuesta lo mismo sin importar
+        cuántas haya almacenadas. Cuando el registro supera WAL_COMPACT_SIZE se
+        compacta en los archivos JSON.
+        """
+        try:
+            if self._wal is None:
+                # Contiene contraseñas en claro: mismos permisos (0600) que
+                # los archivos JSON escritos con _atomic_write
+                flags = (os.O_WRONLY | os.O_APPEND | os.O_CREAT
+                         | getattr(os, 'O_BINARY', 0))
+                fd = os.open(self.wal_file, flags, 0o600)
+                if sys.platform != 'win32':
+                    # Un registro creado por una versión anterior puede tener
+                    # permisos más abiertos
+                    os.fchmod(fd, 0o600)
+                self._wal = os.fdopen(fd, 'ab', buffering=0)
+            record = {'op': 'upsert', 'service': service, 'entry': entry}
+            if history_item is not None:
+                record['history_item'] = history_item
+            self._wal.write(_json_dumps(record) + b'\n')
+            os.fsync(self._wal.fileno())
+            
+            if self._wal.tell() > self.WAL_COMPACT_SIZE:
+                self.save_passwords()
+        except IOError as e:
+            print(f"Error al guardar la contraseña: {e}")
+    
+    def _compact_wal(self):
+        """
+        Vuelca el registro de operaciones a los archivos JSON si tiene cambios
+        pendientes.
+        """
+        if self.wal_file.exists() and self.wal_file.stat().st_size:
+            self.save_passwords()
+    
     def _create_backup(self):
         """Crea una copia de seguridad del archivo de contraseñas."""
         if not self.passwords_file.exists():
@@ -165,58 +722,83 @@ def _create_backup(self):
         max_backups = self.config.get('backup_count', 5)
         
         # Remove old backups if we have too many
-        while len(backups) >= max_backups:
-            backups[0].unlink()
-            backups = backups[1:]
+        for old_backup in backups[:max(0, len(backups) - max_backups + 1)]:
+            old_backup.unlink()
         
         # Create new backup
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_file = backup_dir / f'passwords_{timestamp}.json'
+        if backup_file.exists():
+            backup_file.unlink()
         
-        import shutil
-        shutil.copy2(self.passwords_file, backup_file)
+        # passwords.json nunca se modifica en el sitio (se sustituye entero al
+        # guardar), así que basta con un enlace duro: no se copia ningún byte
+        try:
+            os.link(self.passwords_file, backup_file)
+        except OSError:
+            # Sistemas de archivos distintos o sin soporte de enlaces
+            shutil.copy2(self.passwords_file, backup_file)
 
     def generate_password(self, length: int = 16, use_lower: bool = True, use_upper: bool = True,
                         use_digits: bool = True, use_symbols: bool = True) -> str:
         """Genera una contraseña segura con los parámetros especificados."""
+        return self.generate_batch(1, length, use_lower, use_upper,
+                                   use_digits, use_symbols)[0]
+
+    def generate_batch(self, n: int, length: int = 16, use_lower: bool = True,
+                       use_upper: bool = True, use_digits: bool = True,
+                       use_symbols: bool = True,
+                       fast: bool = False) -> List[str]:
+        """
+        Genera `n` contraseñas seguras de una vez, extrayendo la entropía de
+        todas ellas en un único bloque de os.urandom.
+        
+        Con `fast=True` se usa un PRNG no criptográfico (el Mersenne Twister de
+        random.Random sembrado desde os.urandom, en lugar de PCG64 de NumPy, que
+        no es una dependencia), pensado para generar en masa contraseñas
+        desechables de prueba. No debe usarse para credenciales reales.
+        """
         if length < 8:
             print("¡Advertencia! Una contraseña segura debe tener al menos 8 caracteres.")
             length = 8
 
-        chars = []
-        if use_lower:
-            chars.append(self.char_sets['lowercase'])
-        if use_upper:
-            chars.append(self.char_sets['uppercase'])
-        if use_digits:
-            chars.append(self.char_sets['digits'])
-        if use_symbols:
-            chars.append(self.char_sets['symbols'])
-
-        if not chars:
+        mask = (bool(use_lower) | (bool(use_upper) << 1)
+                | (bool(use_digits) << 2) | (bool(use_symbols) << 3))
+        if not mask:
             raise ValueError("Debe seleccionar al menos un tipo de caracteres")
 
-        all_chars = ''.join(chars)
+        all_chars, chars = _precompute_alphabet(self._classes, mask)
+        randbytes = _fast_randbytes if fast else os.urandom
         
-        # Asegurar que la contraseña incluya al menos un carácter de cada tipo seleccionado
-        password = []
-        if use_lower:
-            password.append(secrets.choice(self.char_sets['lowercase']))
-        if use_upper:
-            password.append(secrets.choice(self.char_sets['uppercase']))
-        if use_digits:
-            password.append(secrets.choice(self.char_sets['digits']))
-        if use_symbols:
-            password.append(secrets.choice(self.char_sets['symbols']))
+        # Caracteres de todas las contraseñas y los obligatorios de cada tipo
+        pool = _random_bytes(all_chars, n * length, randbytes)
+        required = [_random_bytes(char_set, n, randbytes) for char_set in chars]
+        required_count = len(chars)
+        positions = iter(_random_below(length, n * required_count * 2, randbytes))
 
-        # Completar el resto de la contraseña
-        remaining_length = length - len(password)
-        password.extend(secrets.choice(all_chars) for _ in range(remaining_length))
+        passwords = []
+        append = passwords.append
+        for row in range(n):
+            start = row * length
+            password = bytearray(pool[start:start + length])
 
-        # Mezclar los caracteres para mayor aleatoriedad
-        secrets.SystemRandom().shuffle(password)
-        
-        return ''.join(password)
+            # Asegurar que la contraseña incluya al menos un carácter de cada tipo
+            # seleccionado, colocándolo en una posición aleatoria distinta (esto
+            # sustituye al barajado posterior)
+            taken: List[int] = []
+            while len(taken) < required_count:
+                pos = next(positions, None)
+                if pos is None:
+                    positions = iter(
+                        _random_below(length, required_count * 2, randbytes)
+                    )
+                elif pos not in taken:
+                    taken.append(pos)
+            for pos, picks in zip(taken, required):
+                password[pos] = picks[row]
+
+            append(password.decode('ascii'))
+        return passwords
 
     def generate_passphrase(
         self, 
@@ -241,35 +823,80 @@ def generate_passphrase(
         Returns:
             str: Frase de contraseña generada
         """
-        wordlist = WORDS_ES if language.lower() == 'es' else WORDS_EN
+        return self.generate_passphrase_batch(
+            1, words, separator, capitalize, add_number, add_symbol, language
+        )[0]
+
+    def generate_passphrase_batch(
+        self,
+        n: int,
+        words: int = 4,
+        separator: str = '-',
+        capitalize: bool = True,
+        add_number: bool = True,
+        add_symbol: bool = True,
+        language: str = 'es'
+    ) -> List[str]:
+        """
+        Genera `n` frases de contraseña de una vez. Las palabras, números,
+        símbolos y posiciones de todas las frases se extraen en bloque, de modo
+        que el coste por frase se reduce a unir sus palabras.
         
-        # Seleccionar palabras aleatorias
-        selected_words = []
-        for _ in range(words):
-            word = secrets.choice(wordlist)
-            if capitalize:
-                word = word.capitalize()
-            selected_words.append(word)
+        Returns:
+            List[str]: Frases de contraseña generadas
+        """
+        wordlist = self._get_wordlist(language, capitalize)
+        symbols = self.char_sets['symbols']
+        add_symbol = add_symbol and bool(symbols)
         
-        passphrase = separator.join(selected_words)
+        # Seleccionar todas las palabras aleatorias en una sola llamada
+        selected_words = _SYSRAND.choices(wordlist, k=n * words)
         
-        # Añadir número si está habilitado
-        if add_number:
-            number = str(secrets.randbelow(90) + 10)  # Número entre 10 y 99
-            if secrets.randbelow(2):  # 50% de probabilidad al principio o al final
-                passphrase = number + separator + passphrase
-            else:
-                passphrase = passphrase + separator + number
+        # Números entre 10 y 99, símbolos y lado (principio o final) de cada añadido
+        numbers = _random_below(90, n) if add_number else []
+        picked_symbols = _random_string(symbols, n) if add_symbol else ''
+        sides = _random_below(2, 2 * n)
         
-        # Añadir símbolo si está habilitado
-        if add_symbol and self.char_sets['symbols']:
-            symbol = secrets.choice(self.char_sets['symbols'])
-            if secrets.randbelow(2):  # 50% de probabilidad al principio o al final
-                passphrase = symbol + passphrase
-            else:
-                passphrase = passphrase + symbol
+        passphrases = []
+        for row in range(n):
+            passphrase = separator.join(selected_words[row * words:(row + 1) * words])
+            
+            # Añadir número si está habilitado
+            if add_number:
+                number = str(numbers[row] + 10)
+                if sides[2 * row]:  # 50% de probabilidad al principio o al final
+                    passphrase = number + separator + passphrase
+                else:
+                    passphrase = passphrase + separator + number
+            
+            # Añadir símbolo si está habilitado
+            if add_symbol:
+                symbol = picked_symbols[row]
+                if sides[2 * row + 1]:  # 50% de probabilidad al principio o al final
+                    passphrase = symbol + passphrase
+                else:
+                    passphrase = passphrase + symbol
+            
+            passphrases.append(passphrase)
         
-        return passphrase
+        return passphrases
+
+    @classmethod
+    def _get_wordlist(cls, language: str, capitalize: bool = False) -> Tuple[str, ...]:
+        """
+        Devuelve la lista de palabras del idioma (ya capitalizadas si se pide),
+        construyéndola solo la primera vez.
+        """
+        key = ('es' if language.lower() == 'es' else 'en', bool(capitalize))
+        wordlist = cls._WORDLISTS.get(key)
+        if wordlist is None:
+            words = WORDS_ES if key[0] == 'es' else WORDS_EN
+            if capitalize:
+                wordlist = tuple(w.capitalize() for w in words)
+            else:
+                wordlist = tuple(words)
+            cls._WORDLISTS[key] = wordlist
+        return wordlist
 
     def check_strength(self, password: str) -> Tuple[PasswordStrength, str, Dict]:
         """
@@ -280,16 +907,18 @@ def check_strength(self, password: str) -> Tuple[PasswordStrength, str, Dict]:
         """
         if not password:
             return PasswordStrength.VERY_WEAK, "Muy débil", {}
+        
+        mask = self._class_mask(password)
             
         details = {
             'length': len(password),
-            'has_lower': any(c.islower() for c in password),
-            'has_upper': any(c.isupper() for c in password),
-            'has_digit': any(c.isdigit() for c in password),
-            'has_symbol': any(c in self.char_sets['symbols'] for c in password),
+            'has_lower': bool(mask & 1),
+            'has_upper': bool(mask & 2),
+            'has_digit': bool(mask & 4),
+            'has_symbol': bool(mask & 8),
             'has_repeats': len(set(password)) < len(password) * 0.7,
             'is_common': self._is_common_password(password),
-            'entropy': self._calculate_entropy(password)
+            'entropy': self._calculate_entropy(password, mask)
         }
         
         # Calculate score
@@ -302,14 +931,7 @@ def check_strength(self, password: str) -> Tuple[PasswordStrength, str, Dict]:
             score += 1
             
         # Character diversity
-        if details['has_lower']:
-            score += 1
-        if details['has_upper']:
-            score += 1
-        if details['has_digit']:
-            score += 1
-        if details['has_symbol']:
-            score += 1
+        score += bin(mask).count('1')
             
         # Deductions
         if details['is_common']:
@@ -338,36 +960,161 @@ def check_strength(self, password: str) -> Tuple[PasswordStrength, str, Dict]:
         strength_enum, strength_name = strength_map.get(score, (PasswordStrength.VERY_WEAK, "Desconocida"))
         return strength_enum, strength_name, details
     
-    def _calculate_entropy(self, password: str) -> float:
-        """Calcula la entropía de una contraseña en bits."""
+    def check_strength_batch(self, passwords: List[str]) -> List[PasswordStrength]:
+        """
+        Evalúa la fortaleza de varias contraseñas de una vez. Cada contraseña
+        distinta se evalúa una sola vez aunque aparezca repetida en el lote.
+        
+        Returns:
+            List[PasswordStrength]: Fortaleza de cada contraseña, en el mismo orden
+        """
+        unique = list(dict.fromkeys(passwords))
+        results = None
+        workers = os.cpu_count() or 1
+        if workers > 1 and len(unique) >= self.STRENGTH_PARALLEL_MIN:
+            # La evaluación es Python puro: se reparte entre procesos, que
+            # reciben solo el estado necesario para evaluar (no la bóveda)
+            chunksize = max(1, len(unique) // (4 * workers))
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_strength_worker,
+                    initargs=(self._strength_state(),),
+                ) as executor:
+                    results = list(executor.map(
+                        _strength_worker_check, unique, chunksize=chunksize
+                    ))
+            except (OSError, RuntimeError) as e:
+                print("No se pudo evaluar en paralelo, "
+                      f"se continúa en un solo proceso: {e}")
+        if results is None:
+            results = [self.check_strength(password)[0] for password in unique]
+        
+        strengths = dict(zip(unique, results))
+        return [strengths[password] for password in passwords]
+    
+    def _strength_state(
+        self,
+    ) -> Tuple[Dict[str, str], FrozenSet[str], Optional[_BloomFilter]]:
+        """
+        Estado que necesita check_strength, para reconstruir el evaluador en
+        otro proceso.
+        """
+        return self.char_sets, self._symbol_set, self._get_common_filter()
+    
+    @classmethod
+    def _strength_checker(cls, state) -> 'PasswordGenerator':
+        """
+        Crea un generador mínimo, sin bóveda ni archivos, capaz solo de
+        evaluar fortaleza.
+        """
+        checker = cls.__new__(cls)
+        checker.char_sets, checker._symbol_set, checker._common_filter = state
+        checker._common_filter_loaded = True
+        return checker
+    
+    def _class_mask(self, password: str) -> int:
+        """
+        Clasifica la contraseña en una sola pasada y devuelve la máscara de tipos
+        de caracteres presentes: 1=minúscula, 2=mayúscula, 4=dígito, 8=símbolo.
+        """
+        mask = 0
+        if password.isascii():
+            # Caso habitual: cada byte se clasifica con la tabla precalculada
+            table = _CLASS_TABLE
+            for b in password.encode('ascii'):
+                mask |= table[b]
+                if mask == 15:
+                    break
+        else:
+            # Con caracteres no ASCII se conservan las reglas Unicode de str
+            symbols = self._symbol_set
+            for c in password:
+                if c.islower():
+                    mask |= 1
+                elif c.isupper():
+                    mask |= 2
+                elif c.isdigit():
+                    mask |= 4
+                elif c in symbols:
+                    mask |= 8
+                if mask == 15:
+                    break
+        return mask
+    
+    def _calculate_entropy(self, password: str, mask: Optional[int] = None) -> float:
+        """
+        Calcula la entropía de una contraseña en bits.
+        
+        Args:
+            password: Contraseña a evaluar
+            mask: Máscara de tipos de caracteres ya calculada con _class_mask,
+                si se tiene
+        """
         if not password:
             return 0.0
+        if mask is None:
+            mask = self._class_mask(password)
             
         # Determine character pool size
         pool_size = 0
-        if any(c.islower() for c in password):
+        if mask & 1:
             pool_size += 26
-        if any(c.isupper() for c in password):
+        if mask & 2:
             pool_size += 26
-        if any(c.isdigit() for c in password):
+        if mask & 4:
             pool_size += 10
-        if any(c in self.char_sets['symbols'] for c in password):
+        if mask & 8:
             pool_size += len(self.char_sets['symbols'])
             
         # Calculate entropy
-        import math
-        entropy = len(password) * math.log2(pool_size) if pool_size > 0 else 0
+        entropy = len(password) * _LOG2(pool_size) if pool_size > 0 else 0
         return entropy
     
     def _is_common_password(self, password: str) -> bool:
         """Verifica si la contraseña está en la lista de contraseñas comunes."""
-        common_passwords = {
-            'password', '123456', '12345678', '1234', 'qwerty', '12345',
-            'dragon', 'baseball', 'football', 'letmein', 'monkey',
-            'mustang', 'michael', 'shadow', 'master', 'jennifer',
-            '111111', '2000', 'jordan', 'superman', 'harley', '1234567'
-        }
-        return password.lower() in common_passwords
+        lowered = password.lower()
+        if lowered in _COMMON_PASSWORDS:
+            return True
+        common_filter = self._get_common_filter()
+        return common_filter is not None and lowered in common_filter
+    
+    def _get_common_filter(self) -> Optional[_BloomFilter]:
+        """Carga (una sola vez) el filtro de Bloom de contraseñas comunes, si existe."""
+        if not self._common_filter_loaded:
+            self._common_filter_loaded = True
+            if self.common_filter_file.exists():
+                try:
+                    self._common_filter = _BloomFilter.load(self.common_filter_file)
+                except (IOError, ValueError, struct.error) as e:
+                    print(f"Error al cargar el filtro de contraseñas comunes: {e}")
+        return self._common_filter
+    
+    def build_common_password_filter(self, wordlist_file: str,
+                                     error_rate: float = 1e-6) -> int:
+        """
+        Construye el filtro de Bloom de contraseñas comunes a partir de una lista
+        de texto (una contraseña por línea, p. ej. rockyou de SecLists) y lo
+        guarda en el directorio de datos.
+        
+        Args:
+            wordlist_file: Ruta de la lista de contraseñas
+            error_rate: Tasa de falsos positivos admitida
+            
+        Returns:
+            int: Número de contraseñas añadidas al filtro
+        """
+        with open(wordlist_file, 'r', encoding='utf-8', errors='ignore') as f:
+            words = {line.strip().lower() for line in f if line.strip()}
+        
+        common_filter = _BloomFilter.for_capacity(len(words), error_rate)
+        for word in words:
+            common_filter.add(word)
+        common_filter.save(self.common_filter_file)
+        
+        self._common_filter = common_filter
+        self._common_filter_loaded = True
+        return len(words)
 
     def save_password(
         self, 
@@ -399,26 +1146,28 @@ def save_password(
         service_lower = service.lower().strip()
         
         # Verificar si ya existe una entrada para este servicio
+        history_item = None
         if service_lower in self.passwords:
             # Mover la contraseña actual al historial
             if service_lower not in self.history:
                 self.history[service_lower] = []
                 
             # Guardar la versión anterior en el historial
-            self.history[service_lower].append({
+            history_item = {
                 'password': self.passwords[service_lower].password,
                 'updated_at': self.passwords[service_lower].updated_at,
                 'changed_by': os.getlogin() if 'getlogin' in dir(os) else 'system'
-            })
+            }
+            self.history[service_lower].append(history_item)
             
-            # Limitar el historial a las últimas 5 versiones
-            self.history[service_lower] = self.history[service_lower][-5:]
+            # Limitar el historial a las últimas versiones
+            del self.history[service_lower][:-self.HISTORY_LIMIT]
             
             # Actualizar la entrada existente
             entry = self.passwords[service_lower]
             entry.password = password
             entry.username = username or entry.username
-            entry.updated_at = datetime.now().isoformat()
+            entry.updated_at = _now_iso()
             if expires_in_days is not None:
                 entry.expires_in_days = expires_in_days
             if notes:
@@ -443,76 +1192,180 @@ def save_password(
         # Verificar si la contraseña está comprometida
         entry.is_compromised = self._check_if_compromised(password)
         
-        # Guardar la entrada
+        # Guardar la entrada y su historial en el registro de operaciones
+        self._index_password(service_lower, entry.password)
         self.passwords[service_lower] = entry
-        self.save_passwords()
+        self._append_wal(service_lower, entry, history_item)
         
-        # Guardar el historial
+        return True
+    
+    def _get_hibp_session(self):
+        """
+        Devuelve la sesión HTTP reutilizable para la API de HIBP, creándola la
+        primera vez.
+        """
+        with self._hibp_lock:
+            if self._hibp_session is None:
+                if requests is None or HTTPAdapter is None or Retry is None:
+                    raise ImportError("la biblioteca requests no está instalada")
+                session = requests.Session()
+                retries = Retry(total=3, backoff_factor=1,
+                                status_forcelist=[500, 502, 503, 504])
+                adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                                      max_retries=retries)
+                session.mount('https://', adapter)
+                session.headers['User-Agent'] = 'PasswordGenerator/2.0'
+                self._hibp_session = session
+            return self._hibp_session
+    
+    def _get_hibp_db(self) -> sqlite3.Connection:
+        """
+        Devuelve la conexión a la caché local de rangos de HIBP, creándola la
+        primera vez.
+        """
+        if self._hibp_db is None:
+            db = sqlite3.connect(str(self.hibp_cache_file), check_same_thread=False)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('CREATE TABLE IF NOT EXISTS prefix_cache('
+                       'prefix TEXT PRIMARY KEY, body TEXT, fetched_at INTEGER)')
+            self._hibp_db = db
+        return self._hibp_db
+    
+    def _fetch_hibp_range(self, prefix: str) -> Dict[str, int]:
+        """
+        Obtiene los sufijos de hash filtrados que comparten el prefijo dado. Cada
+        prefijo se consulta a la API como mucho una vez por proceso, y las
+        respuestas se guardan en una caché local durante HIBP_CACHE_TTL segundos.
+        """
+        cached = self._hibp_cache.get(prefix)
+        if cached is not None:
+            return cached
+        
+        body = None
         try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.history, f, ensure_ascii=False, indent=2)
-        except IOError as e:
-            print(f"Error al guardar el historial: {e}")
+            with self._hibp_lock:
+                row = self._get_hibp_db().execute(
+                    'SELECT body FROM prefix_cache WHERE prefix = ? AND fetched_at > ?',
+                    (prefix, int(time.time()) - self.HIBP_CACHE_TTL)
+                ).fetchone()
+            if row is not None:
+                body = row[0]
+        except sqlite3.Error:
+            pass
         
-        return True
+        if body is None:
+            response = self._get_hibp_session().get(
+                f'https://api.pwnedpasswords.com/range/{prefix}',
+                timeout=5
+            )
+            if response.status_code != 200:
+                return {}
+            body = response.text
+            try:
+                with self._hibp_lock:
+                    db = self._get_hibp_db()
+                    db.execute('INSERT OR REPLACE INTO prefix_cache VALUES (?, ?, ?)',
+                               (prefix, body, int(time.time())))
+                    db.commit()
+            except sqlite3.Error:
+                pass
+        
+        suffixes: Dict[str, int] = {}
+        for line in body.splitlines():
+            suffix, sep, count = line.partition(':')
+            if sep:
+                suffixes[suffix] = int(count)
+        self._hibp_cache[prefix] = suffixes
+        return suffixes
     
-    def _check_if_compromised(self, password: str) -> bool:
+    def _check_if_compromised(self, password: str,
+                              password_hash: Optional[str] = None) -> bool:
         """
         Verifica si una contraseña ha sido comprometida usando el algoritmo k-anonimity
         con la API de Have I Been Pwned.
+        
+        Args:
+            password: Contraseña a verificar
+            password_hash: Hash SHA-1 en hexadecimal (mayúsculas) ya calculado,
+                si se tiene
         """
         if not password or not self.config.get('auto_check_compromised', True):
             return False
             
         try:
             # Hash SHA-1 de la contraseña
-            password_hash = hashlib.sha1(password.encode('utf-8')).hexdigest().upper()
-            prefix = password_hash[:5]
-            
-            # Realizar la solicitud a la API de HIBP
-            import requests
-            from requests.adapters import HTTPAdapter, Retry
+            if password_hash is None:
+                password_hash = _sha1_upper(password)
             
-            session = requests.Session()
-            retries = Retry(total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504])
-            session.mount('https://', HTTPAdapter(max_retries=retries))
-            
-            response = session.get(
-                f'https://api.pwnedpasswords.com/range/{prefix}',
-                headers={'User-Agent': 'PasswordGenerator/2.0'},
-                timeout=5
-            )
-            
-            if response.status_code == 200:
-                # Buscar el sufijo del hash en la respuesta
-                suffix = password_hash[5:]
-                for line in response.text.splitlines():
-                    if line.startswith(suffix):
-                        count = int(line.split(':')[1])
-                        return count > 0
-            
-            return False
+            # Buscar el sufijo del hash en el rango de su prefijo
+            hashes = self._fetch_hibp_range(password_hash[:5])
+            return hashes.get(password_hash[5:], 0) > 0
             
         except Exception as e:
             print(f"Advertencia: No se pudo verificar si la contraseña está comprometida: {e}")
             return False
     
+    def _precompute_hibp_prefixes(
+        self
+    ) -> Dict[str, List[Tuple[str, PasswordEntry, str]]]:
+        """
+        Calcula de una vez el hash SHA-1 de las contraseñas aún no marcadas como
+        comprometidas y las agrupa por prefijo:
+        {prefijo: [(servicio, entrada, sufijo)]}.
+        
+        Con bóvedas grandes el cálculo se reparte entre varios hilos; con pocas
+        entradas se hace en el hilo actual, donde el reparto costaría más que
+        los propios hashes.
+        """
+        items = [(service, entry) for service, entry in self.passwords.items()
+                 if not entry.is_compromised and entry.password]
+        passwords = [entry.password for _, entry in items]
+        if len(passwords) >= self.HIBP_PARALLEL_HASH_MIN:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                hashes = list(executor.map(_sha1_upper, passwords))
+        else:
+            hashes = list(map(_sha1_upper, passwords))
+        
+        pending: Dict[str, List[Tuple[str, PasswordEntry, str]]] = defaultdict(list)
+        for (service, entry), password_hash in zip(items, hashes):
+            pending[password_hash[:5]].append((service, entry, password_hash[5:]))
+        return pending
+    
     def _check_compromised_passwords(self):
-        """Verifica todas las contraseñas guardadas para ver si han sido comprometidas."""
+        """
+        Verifica todas las contraseñas guardadas para ver si han sido comprometidas.
+        
+        Las contraseñas se agrupan por prefijo de hash y cada prefijo distinto se
+        consulta una sola vez, en paralelo y reutilizando la misma sesión HTTP.
+        """
         if not self.config.get('auto_check_compromised', True):
             return
-            
+        
+        pending = self._precompute_hibp_prefixes()
+        if not pending:
+            return
+        
+        def fetch(prefix: str) -> Dict[str, int]:
+            try:
+                return self._fetch_hibp_range(prefix)
+            except Exception as e:
+                print("Advertencia: No se pudo verificar si la contraseña está "
+                      f"comprometida: {e}")
+                return {}
+        
+        with ThreadPoolExecutor(max_workers=min(16, len(pending))) as executor:
+            ranges = dict(zip(pending, executor.map(fetch, pending)))
+        
         updated = False
-        for service, entry in self.passwords.items():
-            if not entry.is_compromised:  # Solo verificar si no está ya marcada como comprometida
-                is_compromised = self._check_if_compromised(entry.password)
-                if is_compromised != entry.is_compromised:
-                    entry.is_compromised = is_compromised
+        for prefix, items in pending.items():
+            suffixes = ranges[prefix]
+            for service, entry, suffix in items:
+                if suffixes.get(suffix, 0) > 0:
+                    entry.is_compromised = True
                     updated = True
-                    
-                    if is_compromised:
-                        print(f"¡Advertencia! La contraseña para '{service}' ha sido comprometida. "
-                              f"Se recomienda cambiarla de inmediato.")
+                    print(f"¡Advertencia! La contraseña para '{service}' "
+                          "ha sido comprometida. "
+                          "Se recomienda cambiarla de inmediato.")
         
         if updated:
             self.save_passwords()
@@ -529,16 +1382,18 @@ def get_expiring_passwords(self, days_threshold: int = 14) -> List[Dict]:
         """
         expiring = []
         now = datetime.now()
+        # 0 <= (expiry_date - now).days <= days_threshold equivale a
+        # now <= expiry_date < limit
+        limit = now + timedelta(days=days_threshold + 1)
         
         for service, entry in self.passwords.items():
             if entry.expires_in_days is None:
                 continue
                 
-            created_at = datetime.fromisoformat(entry.created_at)
-            expiry_date = created_at + timedelta(days=entry.expires_in_days)
-            days_until_expiry = (expiry_date - now).days
+            expiry_date = entry.created_at_dt + timedelta(days=entry.expires_in_days)
             
-            if 0 <= days_until_expiry <= days_threshold:
+            if now <= expiry_date < limit:
+                days_until_expiry = (expiry_date - now).days
                 expiring.append({
                     'service': service,
                     'username': entry.username,
@@ -559,20 +1414,48 @@ def find_duplicate_passwords(self) -> Dict[str, List[Dict]]:
             Un diccionario donde las claves son hashes de contraseñas y los valores son listas
             de servicios que usan esa contraseña.
         """
-        password_map = defaultdict(list)
-        
+        # Filtrar solo las contraseñas duplicadas y calcular un único hash por grupo
+        duplicates = {}
+        for password, services in self._dupe_index.items():
+            if len(services) > 1:
+                key = hashlib.blake2b(password.encode('utf-8'),
+                                      digest_size=16).hexdigest()
+                duplicates[key] = [{
+                    'service': service,
+                    'username': entry.username,
+                    'strength': entry.strength.name if entry.strength else 'UNKNOWN',
+                    'created_at': entry.created_at
+                } for service, entry in ((svc, self.passwords[svc])
+                                         for svc in services)]
+        return duplicates
+    
+    def _rebuild_dupe_index(self):
+        """
+        Reconstruye en una pasada el índice inverso contraseña -> servicios que
+        usa find_duplicate_passwords. save_password lo mantiene al día; tras
+        modificar self.passwords por otra vía hay que reconstruirlo.
+        """
+        # Diccionarios con valores None como conjuntos ordenados de servicios
+        self._dupe_index: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._indexed_password: Dict[str, str] = {}
         for service, entry in self.passwords.items():
-            # Usamos el hash de la contraseña para agrupar
-            password_hash = hashlib.sha256(entry.password.encode('utf-8')).hexdigest()
-            password_map[password_hash].append({
-                'service': service,
-                'username': entry.username,
-                'strength': entry.strength.name if entry.strength else 'UNKNOWN',
-                'created_at': entry.created_at
-            })
-        
-        # Filtrar solo las contraseñas que están duplicadas
-        return {k: v for k, v in password_map.items() if len(v) > 1}
+            self._dupe_index[entry.password][service] = None
+            self._indexed_password[service] = entry.password
+    
+    def _index_password(self, service: str, password: str):
+        """
+        Actualiza el índice de duplicados cuando un servicio pasa a usar
+        `password`.
+        """
+        old_password = self._indexed_password.get(service)
+        if old_password is not None:
+            services = self._dupe_index.get(old_password)
+            if services is not None:
+                services.pop(service, None)
+                if not services:
+                    del self._dupe_index[old_password]
+        self._dupe_index[password][service] = None
+        self._indexed_password[service] = password
     
     def export_passwords(self, output_file: str, format_type: str = 'json', master_password: str = None) -> bool:
         """
@@ -587,75 +1470,48 @@ def export_passwords(self, output_file: str, format_type: str = 'json', master_p
             bool: True si la exportación fue exitosa, False en caso contrario
         """
         try:
-            data = {k: asdict(v) for k, v in self.passwords.items()}
-            
             if format_type.lower() == 'json':
-                output = json.dumps(data, ensure_ascii=False, indent=2)
+                output = _json_dumps(self.passwords, indent=True)
             elif format_type.lower() == 'csv':
-                import csv
-                import io
-                
-                # Preparar los datos para CSV
-                rows = []
-                for service, entry in data.items():
-                    row = {
-                        'service': service,
-                        'username': entry.get('username', ''),
-                        'password': entry.get('password', ''),
-                        'created_at': entry.get('created_at', ''),
-                        'updated_at': entry.get('updated_at', ''),
-                        'strength': entry.get('strength', '')
-                    }
-                    rows.append(row)
-                
-                # Escribir a un buffer primero
+                # Escribir a un buffer primero, directamente desde las entradas
                 output_buffer = io.StringIO()
-                if rows:
-                    writer = csv.DictWriter(output_buffer, fieldnames=rows[0].keys())
-                    writer.writeheader()
-                    writer.writerows(rows)
-                output = output_buffer.getvalue()
+                if self.passwords:
+                    writer = csv.writer(output_buffer)
+                    writer.writerow(_CSV_EXPORT_HEADER)
+                    writer.writerows(
+                        (service, entry.username, entry.password, entry.created_at,
+                         entry.updated_at, entry.strength)
+                        for service, entry in self.passwords.items()
+                    )
+                output = output_buffer.getvalue().encode('utf-8')
             else:
                 print(f"Formato de exportación no soportado: {format_type}")
                 return False
             
             # Cifrar si se proporciona una contraseña maestra
             if master_password:
-                try:
-                    from cryptography.fernet import Fernet
-                    from cryptography.hazmat.primitives import hashes
-                    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-                    import base64
-                    
+                if Fernet is not None:
                     # Generar una clave a partir de la contraseña maestra
-                    salt = os.urandom(16)
-                    kdf = PBKDF2HMAC(
-                        algorithm=hashes.SHA256(),
-                        length=32,
-                        salt=salt,
-                        iterations=100000,
-                    )
-                    key = base64.urlsafe_b64encode(kdf.derive(master_password.encode()))
-                    f = Fernet(key)
+                    salt = os.urandom(_EXPORT_SALT_LENGTH)
+                    fernet = Fernet(self._derive_export_key(master_password, salt))
                     
                     # Cifrar los datos
-                    encrypted_data = f.encrypt(output.encode())
+                    encrypted_data = fernet.encrypt(output)
                     
-                    # Guardar los datos cifrados junto con la sal
-                    with open(output_file, 'wb') as f:
-                        f.write(salt + b'::' + encrypted_data)
+                    # Guardar los datos cifrados junto con el algoritmo y la sal
+                    _atomic_write(Path(output_file),
+                                  _SCRYPT_HEADER + salt + b'::' + encrypted_data)
                     
                     print(f"Contraseñas exportadas y cifradas correctamente en {output_file}")
                     return True
-                    
-                except ImportError:
-                    print("Advertencia: No se pudo importar la biblioteca de cifrado. "
-                          "Instala cryptography con 'pip install cryptography' para habilitar el cifrado.")
-                    print("Exportando sin cifrar...")
+                
+                print("Advertencia: No se pudo importar la biblioteca de cifrado. "
+                      "Instala cryptography con 'pip install cryptography' "
+                      "para habilitar el cifrado.")
+                print("Exportando sin cifrar...")
             
-            # Guardar sin cifrar
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(output)
+            # Guardar sin cifrar, con el mismo reemplazo atómico que el almacén
+            _atomic_write(Path(output_file), output)
             
             print(f"Contraseñas exportadas correctamente a {output_file}")
             return True
@@ -664,6 +1520,27 @@ def export_passwords(self, output_file: str, format_type: str = 'json', master_p
             print(f"Error al exportar las contraseñas: {e}")
             return False
     
+    @staticmethod
+    def _derive_export_key(master_password: str, salt: bytes,
+                           kdf: str = 'scrypt') -> bytes:
+        """
+        Deriva la clave Fernet de una exportación cifrada a partir de la
+        contraseña maestra. Las exportaciones nuevas usan scrypt; 'pbkdf2' se
+        mantiene para poder importar las antiguas.
+        """
+        if Scrypt is None or PBKDF2HMAC is None or hashes is None:
+            raise ImportError("la biblioteca cryptography no está instalada")
+        if kdf == 'scrypt':
+            derivation = Scrypt(salt=salt, length=32, n=2**15, r=8, p=1)
+        else:
+            derivation = PBKDF2HMAC(
+                algorithm=hashes.SHA256(),
+                length=32,
+                salt=salt,
+                iterations=100000,
+            )
+        return base64.urlsafe_b64encode(derivation.derive(master_password.encode()))
+    
     def import_passwords(self, input_file: str, format_type: str = None, master_password: str = None) -> bool:
         """
         Importa contraseñas desde un archivo.
@@ -692,47 +1569,46 @@ def import_passwords(self, input_file: str, format_type: str = None, master_pass
                     return False
             
             # Leer el archivo
-            with open(input_file, 'rb') as f:
-                file_content = f.read()
+            file_content = _read_sequential(input_file)
             
-            # Verificar si el archivo está cifrado (comienza con una sal seguida de '::')
-            if file_content.startswith(b'salt::') or (b'::' in file_content[:64]):
+            # Verificar si el archivo está cifrado (comienza con la cabecera de scrypt
+            # o, en exportaciones antiguas, con una sal seguida de '::')
+            is_scrypt = file_content.startswith(_SCRYPT_HEADER)
+            if (is_scrypt or file_content.startswith(b'salt::')
+                    or b'::' in file_content[:64]):
                 if not master_password:
+                    import getpass
                     master_password = getpass.getpass("Ingrese la contraseña maestra: ")
                     if not master_password:
                         print("Se requiere una contraseña maestra para importar el archivo cifrado.")
                         return False
                 
+                if Fernet is None or InvalidToken is None:
+                    print("Error: No se pudo importar la biblioteca de cifrado. "
+                          "Instala cryptography con 'pip install cryptography' "
+                          "para importar archivos cifrados.")
+                    return False
+                
                 try:
-                    from cryptography.fernet import Fernet, InvalidToken
-                    from cryptography.hazmat.primitives import hashes
-                    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-                    import base64
-                    
                     # Extraer la sal y los datos cifrados
-                    salt, encrypted_data = file_content.split(b'::', 1)
+                    if is_scrypt:
+                        start = len(_SCRYPT_HEADER)
+                        salt = file_content[start:start + _EXPORT_SALT_LENGTH]
+                        encrypted_data = file_content[start + _EXPORT_SALT_LENGTH + 2:]
+                    else:
+                        salt, encrypted_data = file_content.split(b'::', 1)
                     
                     # Derivar la clave
-                    kdf = PBKDF2HMAC(
-                        algorithm=hashes.SHA256(),
-                        length=32,
-                        salt=salt,
-                        iterations=100000,
-                    )
-                    key = base64.urlsafe_b64encode(kdf.derive(master_password.encode()))
-                    f = Fernet(key)
+                    kdf = 'scrypt' if is_scrypt else 'pbkdf2'
+                    fernet = Fernet(self._derive_export_key(master_password, salt, kdf))
                     
                     # Descifrar los datos
                     try:
-                        file_content = f.decrypt(encrypted_data)
+                        file_content = fernet.decrypt(encrypted_data)
                     except InvalidToken:
                         print("Error: Contraseña maestra incorrecta o archivo corrupto.")
                         return False
                     
-                except ImportError:
-                    print("Error: No se pudo importar la biblioteca de cifrado. "
-                          "Instala cryptography con 'pip install cryptography' para importar archivos cifrados.")
-                    return False
                 except Exception as e:
                     print(f"Error al descifrar el archivo: {e}")
                     return False
@@ -740,53 +1616,105 @@ def import_passwords(self, input_file: str, format_type: str = None, master_pass
             # Procesar el contenido según el formato
             if format_type.lower() == 'json':
                 try:
-                    data = json.loads(file_content)
-                    for service, entry_data in data.items():
-                        # Crear una nueva entrada de contraseña
-                        entry = PasswordEntry(**entry_data)
-                        self.passwords[service.lower()] = entry
+                    # Los archivos grandes se analizan en streaming, una entrada
+                    # cada vez
+                    if ijson is not None and len(file_content) > STREAM_LOAD_MIN_SIZE:
+                        items = ijson.kvitems(io.BytesIO(file_content), '')
+                    else:
+                        items = _json_loads(file_content).items()
+                    
+                    # Las entradas se acumulan aparte y se incorporan de una sola vez
+                    new_entries = {service.lower(): PasswordEntry(**entry_data)
+                                   for service, entry_data in items}
+                    self.passwords.update(new_entries)
+                    imported_count = len(new_entries)
                     
                     # Guardar los cambios
+                    self._rebuild_dupe_index()
                     self.save_passwords()
-                    print(f"Se importaron {len(data)} contraseñas desde {input_file}")
+                    print(f"Se importaron {imported_count} contraseñas "
+                          f"desde {input_file}")
                     return True
                     
-                except json.JSONDecodeError as e:
+                except _JSON_LOAD_ERRORS as e:
                     print(f"Error al analizar el archivo JSON: {e}")
                     return False
                     
             elif format_type.lower() == 'csv':
                 try:
-                    import csv
-                    import io
+                    # Leer el archivo CSV; las columnas se resuelven una sola vez a
+                    # partir de la cabecera y cada fila se lee por posición. Los bytes
+                    # se decodifican por bloques a medida que avanza el lector, sin
+                    # crear una copia decodificada del archivo completo
+                    csv_reader = csv.reader(io.TextIOWrapper(
+                        io.BytesIO(file_content), encoding='utf-8', newline=''
+                    ))
+                    header = next(csv_reader, [])
+                    columns = {name: i for i, name in enumerate(header)}
+                    if 'service' not in columns or 'password' not in columns:
+                        print("Error: El archivo CSV debe contener al menos las "
+                              "columnas 'service' y 'password'.")
+                        return False
                     
-                    # Leer el archivo CSV
-                    csv_reader = csv.DictReader(io.StringIO(file_content.decode('utf-8')))
-                    imported_count = 0
+                    # Las columnas opcionales ausentes apuntan a una columna
+                    # vacía añadida al final, de modo que las filas se leen sin
+                    # comprobaciones por campo
+                    pad_col = len(header)
+                    service_col = columns['service']
+                    password_col = columns['password']
+                    username_col = columns.get('username', pad_col)
+                    created_at_col = columns.get('created_at', pad_col)
+                    notes_col = columns.get('notes', pad_col)
+                    # La fortaleza del archivo solo se usa si lo escribió
+                    # export_passwords
+                    if header == _CSV_EXPORT_HEADER:
+                        strength_col = columns['strength']
+                    else:
+                        strength_col = pad_col
+                    get_fields = operator.itemgetter(
+                        service_col, password_col, username_col,
+                        created_at_col, notes_col, strength_col
+                    )
+                    # Fecha para las filas sin created_at, calculada una sola vez
+                    default_created_at = datetime.now().isoformat()
+                    services: List[str] = []
+                    imported: List[PasswordEntry] = []
                     
                     for row in csv_reader:
-                        if 'service' not in row or 'password' not in row:
-                            print("Error: El archivo CSV debe contener al menos las columnas 'service' y 'password'.")
-                            return False
+                        if not row:
+                            continue
+                        if len(row) != pad_col:
+                            del row[pad_col:]
+                            row += [''] * (pad_col - len(row))
+                        row.append('')
                         
                         # Crear una nueva entrada de contraseña
-                        service = row['service'].lower()
-                        entry = PasswordEntry(
-                            service=row['service'],
-                            password=row['password'],
-                            username=row.get('username', ''),
-                            created_at=row.get('created_at', datetime.now().isoformat()),
-                            notes=row.get('notes', '')
-                        )
-                        
-                        # Calcular la fortaleza de la contraseña
-                        strength_enum, _, _ = self.check_strength(entry.password)
+                        (service, password, username,
+                         created_at, notes, strength) = get_fields(row)
+                        services.append(service)
+                        imported.append(PasswordEntry(
+                            service, password, username,
+                            created_at or default_created_at,
+                            notes=notes,
+                            strength=_STRENGTH_LABELS.get(strength)
+                        ))
+                    
+                    # Normalizar todos los nombres de servicio en una sola pasada
+                    new_entries = dict(zip(map(str.lower, services), imported))
+                    
+                    # Calcular de una vez la fortaleza de las contraseñas importadas que
+                    # no la traían en un formato fiable (las exportaciones propias sí)
+                    pending = [entry for entry in imported if entry.strength is None]
+                    strengths = self.check_strength_batch(
+                        [entry.password for entry in pending]
+                    )
+                    for entry, strength_enum in zip(pending, strengths):
                         entry.strength = strength_enum
-                        
-                        self.passwords[service] = entry
-                        imported_count += 1
+                    self.passwords.update(new_entries)
+                    imported_count = len(imported)
                     
                     # Guardar los cambios
+                    self._rebuild_dupe_index()
                     self.save_passwords()
                     print(f"Se importaron {imported_count} contraseñas desde {input_file}")
                     return True
@@ -817,8 +1745,19 @@ def main():
     parser.add_argument('--service', help='Servicio para el que se genera la contraseña')
     parser.add_argument('-u', '--username', help='Nombre de usuario para guardar con la contraseña')
     parser.add_argument('--check', help='Verificar la fortaleza de una contraseña existente')
+    parser.add_argument('--fast', action='store_true',
+                        help='Usar un generador no criptográfico (Mersenne Twister '
+                             'de random.Random) para generar contraseñas en masa; '
+                             'solo pruebas, no para credenciales reales. '
+                             'No admite -p, -s ni -c')
     
     args = parser.parse_args()
+    if args.fast and (args.save or args.copy):
+        # Lo generado con --fast no es apto como credencial real
+        parser.error("--fast no se puede combinar con --save ni con --copy")
+    if args.fast and args.passphrase:
+        # Las frases de contraseña siempre se generan con el generador seguro
+        parser.error("--fast no se puede combinar con --passphrase")
     
     pg = PasswordGenerator()
     
@@ -827,18 +1766,21 @@ def main():
         print(f"Fortaleza de la contraseña: {strength}")
         return
     
-    for _ in range(args.number):
-        if args.passphrase:
-            password = pg.generate_passphrase(words=args.words)
-        else:
-            password = pg.generate_password(
-                length=args.length,
-                use_lower=args.lower,
-                use_upper=args.upper,
-                use_digits=args.digits,
-                use_symbols=args.symbols
-            )
-        
+    if args.passphrase:
+        passwords = pg.generate_passphrase_batch(args.number, words=args.words)
+    else:
+        # Todas las contraseñas se generan juntas a partir de un solo bloque de entropía
+        passwords = pg.generate_batch(
+            args.number,
+            length=args.length,
+            use_lower=args.lower,
+            use_upper=args.upper,
+            use_digits=args.digits,
+            use_symbols=args.symbols,
+            fast=args.fast
+        )
+    
+    for password in passwords:
         print(f"\nContraseña generada: {password}")
         
         if not args.passphrase:
@@ -847,7 +1789,7 @@ def main():
         
         if args.copy:
             try:
-                pyperclip.copy(password)
+                _copy_to_clipboard(password)
                 print("¡Contraseña copiada al portapapeles!")
             except:
                 print("No se pudo copiar al portapapeles. Asegúrate de tener xclip/xsel instalado en Linux o pyperclip instalado correctamente.")
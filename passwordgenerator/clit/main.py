@@ -1,25 +1,202 @@
 """Main CLI module for the Password Generator."""
 import argparse
+import operator
+import os
+import re
 import sys
-from typing import List, Optional, Dict, Any
+from functools import cached_property
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, FrozenSet, Tuple
 
-from ..storage.manager import StorageManager
-from ..core.generator import PasswordGenerator
-from ..security.strength import PasswordStrength, PasswordStrengthChecker
-from ..models.password import PasswordEntry
+# The generator, storage and strength checker are imported when a command first
+# uses them, so commands such as 'version' or '--help' do not load them
+if TYPE_CHECKING:
+    from ..storage.manager import StorageManager
+    from ..core.generator import PasswordGenerator
+    from ..security.strength import PasswordStrengthChecker
+    from ..models.password import PasswordEntry
+
+# Separator of comma-separated option values (--tags, --chars, --extra), with
+# the whitespace around each comma
+_LIST_SPLIT_RE = re.compile(r'\s*,\s*')
+
+def _split_list(value: Optional[str]) -> List[str]:
+    """Split a comma-separated option value into its non-empty items."""
+    if not value:
+        return []
+    return [item for item in _LIST_SPLIT_RE.split(value.strip()) if item]
+
+# Character classes accepted by 'generate --chars' and 'generate --extra'
+_BASE_CHAR_CLASSES = ('upper', 'lower', 'digits', 'symbols')
+_EXTRA_CHAR_CLASSES = ('brackets', 'punctuation', 'math', 'space')
+
+def _char_class_list(choices: Tuple[str, ...]):
+    """Build an argparse type that parses a comma-separated list of `choices`."""
+    def parse(value: str) -> FrozenSet[str]:
+        names = _split_list(value)
+        unknown = [name for name in names if name not in choices]
+        if unknown:
+            raise argparse.ArgumentTypeError(
+                f"unknown character class: {', '.join(unknown)} "
+                f"(choose from {', '.join(choices)})")
+        return frozenset(names)
+    return parse
+
+_parse_base_chars = _char_class_list(_BASE_CHAR_CLASSES)
+_parse_extra_chars = _char_class_list(_EXTRA_CHAR_CLASSES)
+
+# On/off switches of the generate and passphrase commands: (flag, dest, help)
+# for the ones that turn an option off, (flag, help) for the ones that turn it on
+_GENERATE_EXCLUDE_FLAGS = (
+    ('--no-upper', 'use_upper', 'Exclude uppercase letters'),
+    ('--no-lower', 'use_lower', 'Exclude lowercase letters'),
+    ('--no-digits', 'use_digits', 'Exclude digits'),
+    ('--no-symbols', 'use_symbols', 'Exclude symbols'),
+)
+_GENERATE_INCLUDE_FLAGS = (
+    ('--brackets', 'Include bracket characters ([](){})'),
+    ('--punctuation', 'Include punctuation characters (!?.,;:)'),
+    ('--math', 'Include math symbols (+-*/^=)'),
+    ('--space', 'Include space character'),
+)
+_PASSPHRASE_EXCLUDE_FLAGS = (
+    ('--no-caps', 'capitalize', 'Do not capitalize words'),
+    ('--no-number', 'add_number', 'Do not add a number'),
+    ('--no-symbol', 'add_symbol', 'Do not add a symbol'),
+)
+# flag -> (attribute, value set) for the generate switches above
+_GENERATE_SWITCHES = {
+    **{flag: (dest, False) for flag, dest, _ in _GENERATE_EXCLUDE_FLAGS},
+    **{flag: (flag[2:], True) for flag, _ in _GENERATE_INCLUDE_FLAGS},
+}
+
+# Options of 'generate' that take a value: (attribute they set, value parser)
+_GENERATE_VALUE_OPTIONS = {
+    '-l': ('length', int), '--length': ('length', int),
+    '--chars': ('chars', _parse_base_chars),
+    '--extra': ('extra', _parse_extra_chars),
+    '-s': ('save', str), '--save': ('save', str),
+    '-u': ('username', str), '--username': ('username', str),
+}
+
+def _fast_parse_generate(args: List[str]) -> Optional[argparse.Namespace]:
+    """
+    Parse a plain 'generate' command line without argparse. Returns None for
+    anything it does not handle (help, '--opt=value', unknown or malformed
+    options), so that argparse parses it and reports errors as usual.
+    """
+    parsed = argparse.Namespace(
+        command='generate', length=16, chars=None, extra=frozenset(),
+        copy=False, save=None, username=None,
+        **{dest: True for _, dest, _ in _GENERATE_EXCLUDE_FLAGS},
+        **{flag[2:]: False for flag, _ in _GENERATE_INCLUDE_FLAGS}
+    )
+    tokens = iter(args[1:])
+    for token in tokens:
+        if token in _GENERATE_VALUE_OPTIONS:
+            value = next(tokens, None)
+            if value is None or value.startswith('-'):
+                return None
+            dest, parse = _GENERATE_VALUE_OPTIONS[token]
+            try:
+                setattr(parsed, dest, parse(value))
+            except (ValueError, argparse.ArgumentTypeError):
+                return None
+        elif token in ('-c', '--copy'):
+            parsed.copy = True
+        elif token in _GENERATE_SWITCHES:
+            dest, value = _GENERATE_SWITCHES[token]
+            setattr(parsed, dest, value)
+        else:
+            return None
+    return parsed
+
+def _fast_parse_check(args: List[str]) -> Optional[argparse.Namespace]:
+    """Parse 'check [PASSWORD]' without argparse; None for anything else."""
+    if len(args) > 2 or (len(args) == 2 and args[1].startswith('-')):
+        return None
+    password = args[1] if len(args) == 2 else None
+    return argparse.Namespace(command='check', password=password)
+
+# Commands whose common command lines are parsed without building argparse parsers
+_FAST_PARSERS = {'generate': _fast_parse_generate, 'check': _fast_parse_check}
+
+# Character-type section of the 'check' report
+_CHAR_TYPE_KEYS = ('has_upper', 'has_lower', 'has_digit', 'has_symbol')
+_CHECK_MARKS = {True: '✓', False: '✗'}
+_CHAR_TYPES_TEMPLATE = (
+    "\nCharacter types:\n"
+    "  • Uppercase letters: {}\n"
+    "  • Lowercase letters: {}\n"
+    "  • Digits:            {}\n"
+    "  • Symbols:           {}"
+)
 
 class PasswordCLI:
     """Command-line interface for the Password Generator."""
     
+    # Commands and their help, in the order they are listed. Commands that take
+    # arguments add them in their _add_<command>_arguments builder
+    COMMANDS = {
+        'generate': 'Generate a new password',
+        'passphrase': 'Generate a passphrase',
+        'save': 'Save a password',
+        'get': 'Retrieve a saved password',
+        'search': 'Search saved passwords',
+        'delete': 'Delete a saved password',
+        'check': 'Check password strength',
+        'export': 'Export passwords',
+        'import': 'Import passwords',
+        'version': 'Show version information',
+    }
+    
+    # Argument parsers shared by all instances, built on first use and keyed by
+    # the command whose arguments they include (None for none)
+    _parsers: Dict[Optional[str], argparse.ArgumentParser] = {}
+    
     def __init__(self):
-        """Initialize the CLI with a password generator and storage manager."""
-        self.generator = PasswordGenerator()
-        self.storage = StorageManager()
-        self.strength_checker = PasswordStrengthChecker()
-        self.parser = self._create_parser()
+        """
+        Initialize the CLI; its generator, storage and strength checker are
+        created on first use.
+        """
+        self.parser: Optional[argparse.ArgumentParser] = None
+        self._handlers = {
+            name: getattr(self, f'handle_{name}') for name in self.COMMANDS
+        }
+    
+    @cached_property
+    def generator(self) -> 'PasswordGenerator':
+        """The password generator, created on first use."""
+        from ..core.generator import PasswordGenerator
+        return PasswordGenerator()
+    
+    @cached_property
+    def storage(self) -> 'StorageManager':
+        """The storage manager, created on first use."""
+        from ..storage.manager import StorageManager
+        return StorageManager()
+    
+    @cached_property
+    def strength_checker(self) -> 'PasswordStrengthChecker':
+        """The password strength checker, created on first use."""
+        from ..security.strength import PasswordStrengthChecker
+        return PasswordStrengthChecker()
     
-    def _create_parser(self) -> argparse.ArgumentParser:
-        """Create the argument parser with all commands and options."""
+    @classmethod
+    def _get_parser(cls, command: Optional[str] = None) -> argparse.ArgumentParser:
+        """Return the shared parser for `command`, building it the first time."""
+        parser = cls._parsers.get(command)
+        if parser is None:
+            parser = cls._parsers[command] = cls._create_parser(command)
+        return parser
+    
+    @classmethod
+    def _create_parser(cls, command: Optional[str] = None) -> argparse.ArgumentParser:
+        """
+        Create the argument parser. Only the arguments of `command` are added,
+        since a single invocation never needs the others; the remaining commands
+        are registered by name alone so that help and invalid-choice errors still
+        list all of them.
+        """
         parser = argparse.ArgumentParser(
             description='A secure password generator and manager.',
             epilog='Use "%(prog)s <command> -h" for help on specific commands.'
@@ -27,270 +204,258 @@ def _create_parser(self) -> argparse.ArgumentParser:
         
         # Main subcommands
         subparsers = parser.add_subparsers(dest='command', help='Command to execute')
+        for name, help_text in cls.COMMANDS.items():
+            if name == command:
+                add_arguments = getattr(cls, f'_add_{name}_arguments', None)
+                command_parser = subparsers.add_parser(name, help=help_text)
+                if add_arguments is not None:
+                    add_arguments(command_parser)
+            else:
+                subparsers.add_parser(name, help=help_text, add_help=False)
         
-        # Generate command
-        gen_parser = subparsers.add_parser('generate', help='Generate a new password')
-        gen_parser.add_argument(
+        return parser
+    
+    @staticmethod
+    def _add_generate_arguments(parser: argparse.ArgumentParser) -> None:
+        """Add the arguments of the 'generate' command."""
+        parser.add_argument(
             '-l', '--length',
             type=int,
             default=16,
             help='Password length (default: 16)'
         )
-        gen_parser.add_argument(
-            '--no-upper',
-            action='store_false',
-            dest='use_upper',
-            help='Exclude uppercase letters'
-        )
-        gen_parser.add_argument(
-            '--no-lower',
-            action='store_false',
-            dest='use_lower',
-            help='Exclude lowercase letters'
-        )
-        gen_parser.add_argument(
-            '--no-digits',
-            action='store_false',
-            dest='use_digits',
-            help='Exclude digits'
-        )
-        gen_parser.add_argument(
-            '--no-symbols',
-            action='store_false',
-            dest='use_symbols',
-            help='Exclude symbols'
-        )
-        gen_parser.add_argument(
-            '--brackets',
-            action='store_true',
-            help='Include bracket characters ([](){})'
-        )
-        gen_parser.add_argument(
-            '--punctuation',
-            action='store_true',
-            help='Include punctuation characters (!?.,;:)'
-        )
-        gen_parser.add_argument(
-            '--math',
-            action='store_true',
-            help='Include math symbols (+-*/^=)'
-        )
-        gen_parser.add_argument(
-            '--space',
-            action='store_true',
-            help='Include space character'
-        )
-        gen_parser.add_argument(
+        parser.add_argument(
+            '--chars',
+            type=_parse_base_chars,
+            metavar='CLASSES',
+            help=("Comma-separated character classes to use "
+                  f"(default: all of {','.join(_BASE_CHAR_CLASSES)})")
+        )
+        parser.add_argument(
+            '--extra',
+            type=_parse_extra_chars,
+            default=frozenset(),
+            metavar='CLASSES',
+            help=("Comma-separated extra character classes to add "
+                  f"({','.join(_EXTRA_CHAR_CLASSES)})")
+        )
+        # Single-class switches, kept alongside --chars/--extra
+        for flag, dest, help_text in _GENERATE_EXCLUDE_FLAGS:
+            parser.add_argument(flag, action='store_false', dest=dest, help=help_text)
+        for flag, help_text in _GENERATE_INCLUDE_FLAGS:
+            parser.add_argument(flag, action='store_true', help=help_text)
+        parser.add_argument(
             '-c', '--copy',
             action='store_true',
             help='Copy password to clipboard'
         )
-        gen_parser.add_argument(
+        parser.add_argument(
             '-s', '--save',
             metavar='SERVICE',
             help='Save password for the specified service'
         )
-        gen_parser.add_argument(
+        parser.add_argument(
             '-u', '--username',
             help='Username for the service (use with --save)'
         )
-        
-        # Passphrase command
-        phrase_parser = subparsers.add_parser('passphrase', help='Generate a passphrase')
-        phrase_parser.add_argument(
+    
+    @staticmethod
+    def _add_passphrase_arguments(parser: argparse.ArgumentParser) -> None:
+        """Add the arguments of the 'passphrase' command."""
+        parser.add_argument(
             '-w', '--words',
             type=int,
             default=4,
             help='Number of words (default: 4)'
         )
-        phrase_parser.add_argument(
+        parser.add_argument(
             '-s', '--separator',
             default='-',
             help='Word separator (default: -)'
         )
-        phrase_parser.add_argument(
-            '--no-caps',
-            action='store_false',
-            dest='capitalize',
-            help='Do not capitalize words'
-        )
-        phrase_parser.add_argument(
-            '--no-number',
-            action='store_false',
-            dest='add_number',
-            help='Do not add a number'
-        )
-        phrase_parser.add_argument(
-            '--no-symbol',
-            action='store_false',
-            dest='add_symbol',
-            help='Do not add a symbol'
-        )
-        phrase_parser.add_argument(
+        for flag, dest, help_text in _PASSPHRASE_EXCLUDE_FLAGS:
+            parser.add_argument(flag, action='store_false', dest=dest, help=help_text)
+        parser.add_argument(
             '-l', '--language',
             choices=['en', 'es'],
             default='en',
             help='Word list language (default: en)'
         )
-        phrase_parser.add_argument(
+        parser.add_argument(
             '-c', '--copy',
             action='store_true',
             help='Copy passphrase to clipboard'
         )
-        phrase_parser.add_argument(
+        parser.add_argument(
             '--save',
             metavar='SERVICE',
             help='Save passphrase for the specified service'
         )
-        phrase_parser.add_argument(
+        parser.add_argument(
             '-u', '--username',
             help='Username for the service (use with --save)'
         )
-        
-        # Save command
-        save_parser = subparsers.add_parser('save', help='Save a password')
-        save_parser.add_argument(
+    
+    @staticmethod
+    def _add_save_arguments(parser: argparse.ArgumentParser) -> None:
+        """Add the arguments of the 'save' command."""
+        parser.add_argument(
             'service',
             help='Service or website name'
         )
-        save_parser.add_argument(
+        parser.add_argument(
             'password',
             nargs='?',
             help='Password to save (prompt if not provided)'
         )
-        save_parser.add_argument(
+        parser.add_argument(
             '-u', '--username',
             help='Username or email'
         )
-        save_parser.add_argument(
+        parser.add_argument(
             '-n', '--notes',
             help='Additional notes'
         )
-        save_parser.add_argument(
+        parser.add_argument(
             '-t', '--tags',
             help='Comma-separated list of tags'
         )
-        save_parser.add_argument(
+        parser.add_argument(
             '-e', '--expires',
             type=int,
             help='Days until password expires'
         )
-        
-        # Get command
-        get_parser = subparsers.add_parser('get', help='Retrieve a saved password')
-        get_parser.add_argument(
+    
+    @staticmethod
+    def _add_get_arguments(parser: argparse.ArgumentParser) -> None:
+        """Add the arguments of the 'get' command."""
+        parser.add_argument(
             'service',
             nargs='?',
             help='Service or website name (show all if not provided)'
         )
-        get_parser.add_argument(
+        parser.add_argument(
             '-c', '--copy',
             action='store_true',
             help='Copy password to clipboard'
         )
-        get_parser.add_argument(
+        parser.add_argument(
             '-s', '--show',
             action='store_true',
             help='Show password in plain text'
         )
-        
-        # Search command
-        search_parser = subparsers.add_parser('search', help='Search saved passwords')
-        search_parser.add_argument(
+    
+    @staticmethod
+    def _add_search_arguments(parser: argparse.ArgumentParser) -> None:
+        """Add the arguments of the 'search' command."""
+        parser.add_argument(
             'query',
             nargs='?',
             help='Search term (leave empty to list all)'
         )
-        search_parser.add_argument(
+        parser.add_argument(
             '-f', '--field',
             choices=['service', 'username', 'notes', 'all'],
             default='service',
             help='Field to search (default: service)'
         )
-        search_parser.add_argument(
+        parser.add_argument(
             '-t', '--tags',
             help='Filter by tags (comma-separated)'
         )
-        
-        # Delete command
-        del_parser = subparsers.add_parser('delete', help='Delete a saved password')
-        del_parser.add_argument(
+    
+    @staticmethod
+    def _add_delete_arguments(parser: argparse.ArgumentParser) -> None:
+        """Add the arguments of the 'delete' command."""
+        parser.add_argument(
             'service',
             help='Service or website name'
         )
-        del_parser.add_argument(
+        parser.add_argument(
             '-f', '--force',
             action='store_true',
             help='Skip confirmation'
         )
-        
-        # Check command
-        check_parser = subparsers.add_parser('check', help='Check password strength')
-        check_parser.add_argument(
+    
+    @staticmethod
+    def _add_check_arguments(parser: argparse.ArgumentParser) -> None:
+        """Add the arguments of the 'check' command."""
+        parser.add_argument(
             'password',
             nargs='?',
             help='Password to check (prompt if not provided)'
         )
-        
-        # Export command
-        export_parser = subparsers.add_parser('export', help='Export passwords')
-        export_parser.add_argument(
+    
+    @staticmethod
+    def _add_export_arguments(parser: argparse.ArgumentParser) -> None:
+        """Add the arguments of the 'export' command."""
+        parser.add_argument(
             'file',
             nargs='?',
             default='passwords_export.json',
             help='Output file (default: passwords_export.json)'
         )
-        export_parser.add_argument(
+        parser.add_argument(
             '-f', '--format',
             choices=['json', 'csv'],
             default='json',
             help='Export format (default: json)'
         )
-        export_parser.add_argument(
+        parser.add_argument(
             '-p', '--password',
             help='Encrypt the export with a password'
         )
-        
-        # Import command
-        import_parser = subparsers.add_parser('import', help='Import passwords')
-        import_parser.add_argument(
+    
+    @staticmethod
+    def _add_import_arguments(parser: argparse.ArgumentParser) -> None:
+        """Add the arguments of the 'import' command."""
+        parser.add_argument(
             'file',
             help='Input file'
         )
-        import_parser.add_argument(
+        parser.add_argument(
             '-f', '--format',
             choices=['auto', 'json', 'csv'],
             default='auto',
             help='Input format (default: auto-detect)'
         )
-        import_parser.add_argument(
+        parser.add_argument(
             '-p', '--password',
             help='Password for encrypted imports'
         )
-        
-        # Version command
-        subparsers.add_parser('version', help='Show version information')
-        
-        return parser
     
     def run(self, args: Optional[List[str]] = None) -> int:
         """Run the CLI with the given arguments."""
-        # Parse arguments
-        parsed_args = self.parser.parse_args(args)
+        if args is None:
+            args = sys.argv[1:]
+        if len(args) == 1 and args[0] in _VERSION_ARGS:
+            return _print_version()
+        
+        # Common command lines are parsed directly; the rest go to argparse,
+        # building only the subparser of the requested command (the first
+        # argument that is not an option)
+        fast_parse = _FAST_PARSERS.get(args[0]) if args else None
+        parsed_args = fast_parse(args) if fast_parse else None
+        if parsed_args is None:
+            command = next((arg for arg in args if not arg.startswith('-')), None)
+            if command not in self.COMMANDS:
+                command = None
+            self.parser = self._get_parser(command)
+            parsed_args = self.parser.parse_args(args)
         
         # If no command is provided, show help
         if not parsed_args.command:
-            self.parser.print_help()
+            self._get_parser().print_help()
             return 0
         
         # Dispatch to the appropriate handler
-        try:
-            handler = getattr(self, f'handle_{parsed_args.command}')
-            return handler(parsed_args)
-        except AttributeError:
+        handler = self._handlers.get(parsed_args.command)
+        if handler is None:
             print(f"Unknown command: {parsed_args.command}", file=sys.stderr)
-            self.parser.print_help()
+            self._get_parser().print_help()
             return 1
+        try:
+            return handler(parsed_args)
         except KeyboardInterrupt:
             print("\nOperation cancelled by user.")
             return 1
@@ -303,18 +468,23 @@ def run(self, args: Optional[List[str]] = None) -> int:
     
     def handle_generate(self, args: argparse.Namespace) -> int:
         """Handle the generate command."""
+        # Character classes: --chars narrows the base classes, the --no-* switches
+        # remove from them, and --extra or the single extra switches add to them
+        chars = _BASE_CHAR_CLASSES if args.chars is None else args.chars
+        extra = args.extra
+        
         # Generate the password
         try:
             password = self.generator.generate_password(
                 length=args.length,
-                use_upper=args.use_upper,
-                use_lower=args.use_lower,
-                use_digits=args.use_digits,
-                use_symbols=args.use_symbols,
-                use_brackets=args.brackets,
-                use_punctuation=args.punctuation,
-                use_math=args.math,
-                use_space=args.space
+                use_upper=args.use_upper and 'upper' in chars,
+                use_lower=args.use_lower and 'lower' in chars,
+                use_digits=args.use_digits and 'digits' in chars,
+                use_symbols=args.use_symbols and 'symbols' in chars,
+                use_brackets=args.brackets or 'brackets' in extra,
+                use_punctuation=args.punctuation or 'punctuation' in extra,
+                use_math=args.math or 'math' in extra,
+                use_space=args.space or 'space' in extra
             )
         except ValueError as e:
             print(f"Error: {e}", file=sys.stderr)
@@ -400,7 +570,7 @@ def handle_save(self, args: argparse.Namespace) -> int:
                 return 1
         
         # Parse tags
-        tags = [t.strip() for t in args.tags.split(',')] if args.tags else []
+        tags = _split_list(args.tags)
         
         # Save the password
         success = self.storage.add_password(
@@ -423,16 +593,12 @@ def handle_get(self, args: argparse.Namespace) -> int:
         """Handle the get command."""
         if not args.service:
             # List all services
-            entries = self.storage.search_passwords("")
+            entries = self.storage.list_passwords()
             if not entries:
                 print("No saved passwords found.")
                 return 0
                 
-            print("\nSaved passwords:")
-            print("-" * 80)
-            for entry in sorted(entries, key=lambda e: e.service.lower()):
-                print(f"{entry.service:<30} {entry.username or ''}")
-            print()
+            self._print_entry_list("Saved passwords:", entries)
             return 0
         
         # Get the specific password
@@ -441,47 +607,62 @@ def handle_get(self, args: argparse.Namespace) -> int:
             print(f"No password found for {args.service}", file=sys.stderr)
             return 1
         
-        # Show the entry
-        print(f"\nService:  {entry.service}")
+        # Show the entry, collected into one write
+        lines = [f"\nService:  {entry.service}"]
         if entry.username:
-            print(f"Username: {entry.username}")
+            lines.append(f"Username: {entry.username}")
         
         # Handle password display
         if args.show:
-            print(f"Password: {entry.password}")
+            lines.append(f"Password: {entry.password}")
         elif args.copy:
             try:
                 import pyperclip
                 pyperclip.copy(entry.password)
-                print("Password copied to clipboard!")
+                lines.append("Password copied to clipboard!")
             except Exception as e:
-                print(f"Could not copy to clipboard: {e}")
-                print(f"Password: {'*' * 12}")
+                lines.append(f"Could not copy to clipboard: {e}")
+                lines.append(f"Password: {'*' * 12}")
         else:
-            print(f"Password: {'*' * 12}")
+            lines.append(f"Password: {'*' * 12}")
         
         # Show metadata
         if entry.notes:
-            print(f"\nNotes: {entry.notes}")
+            lines.append(f"\nNotes: {entry.notes}")
         if entry.tags:
-            print(f"Tags: {', '.join(entry.tags)}")
+            lines.append(f"Tags: {', '.join(entry.tags)}")
         
         # Show expiry info
         if entry.expires_in_days:
             days_left = entry.days_until_expiry()
             if days_left is not None:
                 if days_left <= 0:
-                    print("\n\033[91mWARNING: This password has expired!\033[0m")
+                    lines.append("\n\033[91mWARNING: This password has expired!\033[0m")
                 else:
-                    print(f"\nExpires in: {days_left} days")
+                    lines.append(f"\nExpires in: {days_left} days")
         
-        print()
+        lines.append("\n")
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
         return 0
     
+    @staticmethod
+    def _print_entry_list(title: str, entries: List['PasswordEntry']) -> None:
+        """Print entries sorted by service, as one write to stdout."""
+        # Collect the normalized sort keys once and sort positions by them
+        keys = list(map(operator.attrgetter('service_key'), entries))
+        order = sorted(range(len(entries)), key=keys.__getitem__)
+        lines = [f"\n{title}", "-" * 80]
+        lines.extend(f"{entry.service:<30} {entry.username or ''}"
+                     for entry in map(entries.__getitem__, order))
+        lines.append("\n")
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
+    
     def handle_search(self, args: argparse.Namespace) -> int:
         """Handle the search command."""
         # Parse tags
-        tags = [t.strip() for t in args.tags.split(',')] if args.tags else None
+        tags = _split_list(args.tags) or None
         
         # Search for passwords
         results = self.storage.search_passwords(
@@ -495,11 +676,7 @@ def handle_search(self, args: argparse.Namespace) -> int:
             return 0
         
         # Display results
-        print(f"\nFound {len(results)} matching passwords:")
-        print("-" * 80)
-        for entry in sorted(results, key=lambda e: e.service.lower()):
-            print(f"{entry.service:<30} {entry.username or ''}")
-        print()
+        self._print_entry_list(f"Found {len(results)} matching passwords:", results)
         return 0
     
     def handle_delete(self, args: argparse.Namespace) -> int:
@@ -533,29 +710,31 @@ def handle_check(self, args: argparse.Namespace) -> int:
         # Check the strength
         strength, details = self.strength_checker.check_strength(password)
         
-        # Display results
-        print(f"\nPassword strength: \033[1m{strength.name.replace('_', ' ').title()}\033[0m")
-        print(f"Length: {len(password)} characters")
-        print(f"Entropy: {details['entropy']:.1f} bits")
-        
-        # Character types
-        print("\nCharacter types:")
-        print(f"  • Uppercase letters: {'✓' if details['has_upper'] else '✗'}")
-        print(f"  • Lowercase letters: {'✓' if details['has_lower'] else '✗'}")
-        print(f"  • Digits:            {'✓' if details['has_digit'] else '✗'}")
-        print(f"  • Symbols:           {'✓' if details['has_symbol'] else '✗'}")
+        # Display results, collected into one write
+        strength_name = strength.name.replace('_', ' ').title()
+        lines = [
+            f"\nPassword strength: \033[1m{strength_name}\033[0m",
+            f"Length: {len(password)} characters",
+            f"Entropy: {details['entropy']:.1f} bits",
+            # Character types
+            _CHAR_TYPES_TEMPLATE.format(
+                *(_CHECK_MARKS[bool(details[key])] for key in _CHAR_TYPE_KEYS)
+            ),
+        ]
         
         # Feedback
         if details['feedback']:
-            print("\nFeedback:")
-            for msg in details['feedback']:
-                print(f"  • {msg}")
+            lines.append("\nFeedback:")
+            lines.extend(f"  • {msg}" for msg in details['feedback'])
         
         # Suggestions
         if details['suggestions']:
-            print("\nSuggestions to improve:")
-            for suggestion in details['suggestions']:
-                print(f"  • {suggestion}")
+            lines.append("\nSuggestions to improve:")
+            lines.extend(f"  • {suggestion}" for suggestion in details['suggestions'])
+        
+        # Written before the breach check, which may wait on the network
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
         
         # Check for breaches
         from ..security.crypto import check_password_breach
@@ -611,12 +790,74 @@ def handle_import(self, args: argparse.Namespace) -> int:
     
     def handle_version(self, args: argparse.Namespace) -> int:
         """Handle the version command."""
-        from .. import __version__
-        print(f"Password Generator v{__version__}")
-        return 0
+        return _print_version()
+
+# Arguments that only ask for the version, answered without building the CLI
+_VERSION_ARGS = ('version', '--version', '-V')
+
+def _print_version() -> int:
+    """Print the package version."""
+    from .. import __version__
+    print(f"Password Generator v{__version__}")
+    return 0
+
+# Arguments that only ask for the top-level help, printed from the on-disk cache
+_HELP_ARGS = ([], ['-h'], ['--help'])
+
+def _help_cache_file() -> str:
+    """Path of the cached top-level help text."""
+    cache_dir = (os.environ.get('XDG_CACHE_HOME')
+                 or os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(cache_dir, 'password_generator', 'help.txt')
+
+def _top_level_help() -> str:
+    """
+    Return the top-level help text. It is rendered by argparse once and cached
+    on disk; the cache is reused only if it was rendered by the same package
+    version and copy of this module, for the same program name and terminal
+    width.
+    """
+    import shutil
+    from .. import __version__
+    key = "\0".join((
+        __version__,
+        str(os.stat(__file__).st_mtime_ns),
+        os.path.basename(sys.argv[0]),
+        str(shutil.get_terminal_size().columns),
+        '',
+    ))
+    cache_file = _help_cache_file()
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = f.read()
+        if cached.startswith(key):
+            return cached[len(key):]
+    except (OSError, UnicodeDecodeError):
+        pass
+    
+    text = PasswordCLI._get_parser().format_help()
+    # Written to a temporary file and renamed, so a concurrent run never
+    # reads a partially written cache
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(key + text)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+    return text
 
 def main():
     """Entry point for the CLI."""
+    if len(sys.argv) == 2 and sys.argv[1] in _VERSION_ARGS:
+        return _print_version()
+    if sys.argv[1:] in _HELP_ARGS:
+        sys.stdout.write(_top_level_help())
+        return 0
     cli = PasswordCLI()
     return cli.run()
 
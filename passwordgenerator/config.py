@@ -1,61 +1,82 @@
 """Configuration and constants for the password generator."""
 from pathlib import Path
 from typing import Dict, Any, List
+from functools import lru_cache
+import copy
 import json
 import os
 
-# Default word lists for passphrase generation
-WORDS_ES = [
-    'casa', 'perro', 'gato', 'arbol', 'flor', 'sol', 'luna', 'estrella', 'agua', 'fuego',
-    'tierra', 'aire', 'libro', 'lapiz', 'mesa', 'silla', 'ventana', 'puerta', 'cielo', 'mar',
-    'rio', 'montaña', 'nube', 'lluvia', 'viento', 'naturaleza', 'jardin', 'parque', 'calle', 'ciudad',
-    'pueblo', 'pais', 'mundo', 'universo', 'galaxia', 'planeta', 'satelite', 'cometa', 'meteorito', 'estacion',
-    'primavera', 'verano', 'otono', 'invierno', 'manzana', 'naranja', 'platano', 'uva', 'fresa', 'cereza'
-]
+# orjson is optional: when installed it is used to write the configuration file
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
-WORDS_EN = [
-    'apple', 'banana', 'cherry', 'dog', 'cat', 'house', 'tree', 'flower', 'sun', 'moon',
-    'star', 'water', 'fire', 'earth', 'air', 'book', 'pencil', 'table', 'chair', 'window',
-    'door', 'sky', 'sea', 'river', 'mountain', 'cloud', 'rain', 'wind', 'nature', 'garden',
-    'park', 'street', 'city', 'town', 'country', 'world', 'universe', 'galaxy', 'planet', 'satellite',
-    'comet', 'meteor', 'season', 'spring', 'summer', 'autumn', 'winter', 'orange', 'grape', 'strawberry'
-]
+def _dump_json(obj: Any) -> bytes:
+    """Serialize `obj` as indented UTF-8 JSON, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
 
-# Default configuration
-DEFAULT_CONFIG = {
-    'app': {
-        'name': 'Password Generator Pro',
-        'version': '2.0.0',
-        'author': 'Your Name',
-        'license': 'MIT',
-    },
-    'security': {
-        'min_password_length': 8,
-        'max_password_length': 128,
-        'default_password_length': 16,
-        'require_uppercase': True,
-        'require_digits': True,
-        'require_symbols': True,
-        'expire_days': 90,
-        'max_login_attempts': 5,
-        'lockout_minutes': 15,
-    },
-    'storage': {
-        'data_dir': str(Path.home() / '.password_generator'),
-        'passwords_file': 'passwords.json',
-        'config_file': 'config.json',
-        'history_file': 'history.json',
-        'backup_dir': 'backups',
-        'max_backups': 5,
-    },
-    'ui': {
-        'theme': 'system',
-        'language': 'es',
-        'show_strength_meter': True,
-        'copy_to_clipboard': True,
-        'clear_clipboard_after': 30,  # seconds
+def _write_file(path: Path, data: bytes) -> None:
+    """
+    Write `data` to a temporary file and move it over `path`, so it is never
+    left half-written.
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+# Default configuration, built on first use since most runs never need it
+@lru_cache(maxsize=1)
+def _default_config() -> Dict[str, Any]:
+    """Return the default configuration (shared; copy it before modifying)."""
+    return {
+        'app': {
+            'name': 'Password Generator Pro',
+            'version': '2.0.0',
+            'author': 'Your Name',
+            'license': 'MIT',
+        },
+        'security': {
+            'min_password_length': 8,
+            'max_password_length': 128,
+            'default_password_length': 16,
+            'require_uppercase': True,
+            'require_digits': True,
+            'require_symbols': True,
+            'expire_days': 90,
+            'max_login_attempts': 5,
+            'lockout_minutes': 15,
+        },
+        'storage': {
+            'data_dir': os.path.expanduser(os.path.join('~', '.password_generator')),
+            'passwords_file': 'passwords.json',
+            'config_file': 'config.json',
+            'history_file': 'history.json',
+            'backup_dir': 'backups',
+            'max_backups': 5,
+        },
+        'ui': {
+            'theme': 'system',
+            'language': 'es',
+            'show_strength_meter': True,
+            'copy_to_clipboard': True,
+            'clear_clipboard_after': 30,  # seconds
+        }
     }
-}
+
+def __getattr__(name: str) -> Any:
+    """Build module-level defaults and word lists on first access (PEP 562)."""
+    if name == 'DEFAULT_CONFIG':
+        return _default_config()
+    # The word lists now live in .wordlists; kept here for existing importers
+    if name in ('WORDS_ES', 'WORDS_EN'):
+        from .wordlists import get_wordlist
+        return list(get_wordlist(name[-2:].lower()))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class Config:
     """Configuration manager for the application."""
@@ -65,14 +86,19 @@ class Config:
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(Config, cls).__new__(cls)
-            cls._instance._config = {}
-            cls._instance._initialized = False
+            # Loaded from disk on first access, not when the module is imported
+            cls._instance._config = None
+            # (PASSWORD_GENERATOR_CONFIG_DIR value, config path) of the last lookup
+            cls._instance._config_path_cache = None
+            # Whether set() changed anything since the last save()
+            cls._instance._dirty = False
         return cls._instance
     
-    def __init__(self):
-        if not self._initialized:
+    def _ensure_loaded(self) -> Dict[str, Any]:
+        """Load the configuration the first time it is needed and return it."""
+        if self._config is None:
             self._config = self._load_config()
-            self._initialized = True
+        return self._config
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file or use defaults."""
@@ -81,14 +107,14 @@ def _load_config(self) -> Dict[str, Any]:
         # Create default config if it doesn't exist
         if not config_path.exists():
             self._create_default_config()
-            return DEFAULT_CONFIG
+            return copy.deepcopy(_default_config())
         
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except (json.JSONDecodeError, IOError) as e:
             print(f"Error loading config: {e}. Using default configuration.")
-            return DEFAULT_CONFIG
+            return copy.deepcopy(_default_config())
     
     def _create_default_config(self):
         """Create default configuration file."""
@@ -96,22 +122,31 @@ def _create_default_config(self):
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(DEFAULT_CONFIG, f, indent=2)
+            _write_file(config_path, _dump_json(_default_config()))
         except IOError as e:
             print(f"Warning: Could not create config file: {e}")
     
     def get_config_path(self) -> Path:
-        """Get the path to the configuration file."""
+        """
+        Get the path to the configuration file, recomputed only if the override
+        variable changes.
+        """
         config_dir = os.environ.get('PASSWORD_GENERATOR_CONFIG_DIR')
-        if config_dir:
-            return Path(config_dir) / 'config.json'
-        return Path.home() / '.password_generator' / 'config.json'
+        cached = self._config_path_cache
+        if cached is None or cached[0] != config_dir:
+            if config_dir:
+                path = Path(config_dir) / 'config.json'
+            else:
+                path = Path(os.path.expanduser(
+                    os.path.join('~', '.password_generator', 'config.json')
+                ))
+            cached = self._config_path_cache = (config_dir, path)
+        return cached[1]
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value by dot notation."""
         keys = key.split('.')
-        value = self._config
+        value = self._ensure_loaded()
         
         try:
             for k in keys:
@@ -123,7 +158,7 @@ def get(self, key: str, default: Any = None) -> Any:
     def set(self, key: str, value: Any) -> bool:
         """Set a configuration value by dot notation."""
         keys = key.split('.')
-        config = self._config
+        config = self._ensure_loaded()
         
         try:
             for k in keys[:-1]:
@@ -131,22 +166,28 @@ def set(self, key: str, value: Any) -> bool:
                     config[k] = {}
                 config = config[k]
             config[keys[-1]] = value
+            self._dirty = True
             return True
         except (KeyError, TypeError):
             return False
     
     def save(self) -> bool:
-        """Save the current configuration to file."""
+        """
+        Save the current configuration to file, if set() changed it since the
+        last save.
+        """
+        if not self._dirty:
+            return True
         config_path = self.get_config_path()
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(self._config, f, indent=2, ensure_ascii=False)
+            _write_file(config_path, _dump_json(self._ensure_loaded()))
+            self._dirty = False
             return True
         except IOError as e:
             print(f"Error saving config: {e}")
             return False
 
-# Global config instance
+# Global config instance; creating it does no I/O
 config = Config()
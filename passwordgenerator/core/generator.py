@@ -1,7 +1,38 @@
 """Core password generation functionality."""
-import secrets
+import os
+import random
 import string
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, FrozenSet, Optional, Tuple
+
+
+# Whole-password draws to try before forcing one character from each set
+_MAX_REDRAWS = 8
+
+
+def _secure_shuffle(items: list) -> None:
+    """
+    Shuffle a list in place (Fisher-Yates) using one os.urandom call for all
+    swaps. Each swap reduces a 64-bit word modulo at most len(items), so the
+    bias is negligible for password-sized lists.
+    """
+    words = memoryview(os.urandom(8 * len(items))).cast('Q')
+    for i in range(len(items) - 1, 0, -1):
+        j = words[i] % (i + 1)
+        items[i], items[j] = items[j], items[i]
+
+
+@lru_cache(maxsize=64)
+def _resolve_alphabet(
+    char_sets: Tuple[str, ...]
+) -> Tuple[str, Tuple[FrozenSet[str], ...]]:
+    """
+    Return the combined alphabet for a tuple of selected character sets,
+    together with the non-empty sets as frozensets for the coverage check.
+    """
+    required = tuple(frozenset(char_set) for char_set in char_sets if char_set)
+    return ''.join(char_sets), required
+
 
 class PasswordGenerator:
     """Main password generator class."""
@@ -18,6 +49,61 @@ def __init__(self):
             'math': '+=-*/><^',
             'space': ' '
         }
+        # CSPRNG backed by os.urandom, reused so whole batches are drawn in C
+        self._sysrand = random.SystemRandom()
+
+    def _select_char_sets(
+        self,
+        use_lower: bool = True,
+        use_upper: bool = True,
+        use_digits: bool = True,
+        use_symbols: bool = True,
+        use_brackets: bool = False,
+        use_punctuation: bool = False,
+        use_math: bool = False,
+        use_space: bool = False
+    ) -> Tuple[str, ...]:
+        """Return the character sets selected by the given options."""
+        char_set_options = (
+            ('lowercase', use_lower),
+            ('uppercase', use_upper),
+            ('digits', use_digits),
+            ('symbols', use_symbols),
+            ('brackets', use_brackets),
+            ('punctuation', use_punctuation),
+            ('math', use_math),
+            ('space', use_space)
+        )
+        char_sets = self.char_sets
+        chars = tuple(char_sets[name] for name, use in char_set_options
+                      if use and name in char_sets)
+
+        if not chars:
+            raise ValueError("At least one character set must be selected")
+        return chars
+
+    def _draw_password(self, chars: Tuple[str, ...], length: int) -> str:
+        """Draw one password of the given length covering every set in chars."""
+        # Keyed on the set contents, so edits to self.char_sets are picked up
+        all_chars, required = _resolve_alphabet(chars)
+
+        # Draw the whole password at once and redraw while a selected set is
+        # missing, which keeps the result uniform and needs no shuffle
+        choices = self._sysrand.choices
+        for _ in range(_MAX_REDRAWS):
+            password = choices(all_chars, k=length)
+            used = set(password)
+            if not any(char_set.isdisjoint(used) for char_set in required):
+                return ''.join(password)
+
+        # Many small sets at a short length rarely all appear together:
+        # force one character from each set, fill the rest and shuffle
+        choice = self._sysrand.choice
+        password = [choice(char_set) for char_set in chars if char_set]
+        password.extend(choices(all_chars, k=max(0, length - len(password))))
+        _secure_shuffle(password)
+        
+        return ''.join(password)
 
     def generate_password(
         self, 
@@ -35,43 +121,42 @@ def generate_password(
         if length < 8:
             raise ValueError("Password length must be at least 8 characters")
 
-        # Collect character sets based on parameters
-        chars = []
-        char_set_options = {
-            'lowercase': use_lower,
-            'uppercase': use_upper,
-            'digits': use_digits,
-            'symbols': use_symbols,
-            'brackets': use_brackets,
-            'punctuation': use_punctuation,
-            'math': use_math,
-            'space': use_space
-        }
-
-        # Add selected character sets
-        for char_set, use in char_set_options.items():
-            if use and char_set in self.char_sets:
-                chars.append(self.char_sets[char_set])
+        chars = self._select_char_sets(
+            use_lower, use_upper, use_digits, use_symbols,
+            use_brackets, use_punctuation, use_math, use_space
+        )
+        return self._draw_password(chars, length)
 
-        if not chars:
-            raise ValueError("At least one character set must be selected")
+    def generate_passwords(
+        self,
+        count: int,
+        length: int = 16,
+        **options: bool
+    ) -> List[str]:
+        """
+        Generate several passwords with the same parameters.
 
-        all_chars = ''.join(chars)
-        password = []
-        
-        # Ensure at least one character from each selected set
-        for char_set, use in char_set_options.items():
-            if use and char_set in self.char_sets:
-                password.append(secrets.choice(self.char_sets[char_set]))
+        Takes the same keyword options as generate_password. The characters
+        for all passwords are drawn in a single call; a password missing one
+        of the selected sets is redrawn on its own.
+        """
+        if length < 8:
+            raise ValueError("Password length must be at least 8 characters")
+        if count <= 0:
+            return []
 
-        # Fill the rest randomly
-        remaining_length = max(0, length - len(password))
-        password.extend(secrets.choice(all_chars) for _ in range(remaining_length))
+        chars = self._select_char_sets(**options)
+        all_chars, required = _resolve_alphabet(chars)
 
-        # Shuffle to ensure randomness
-        secrets.SystemRandom().shuffle(password)
-        
-        return ''.join(password)
+        buf = ''.join(self._sysrand.choices(all_chars, k=count * length))
+        passwords = []
+        for start in range(0, count * length, length):
+            password = buf[start:start + length]
+            used = set(password)
+            if any(char_set.isdisjoint(used) for char_set in required):
+                password = self._draw_password(chars, length)
+            passwords.append(password)
+        return passwords
 
     def generate_passphrase(
         self,
@@ -83,10 +168,11 @@ def generate_passphrase(
         language: str = 'es'
     ) -> str:
         """Generate a memorable passphrase."""
-        from ..config import WORDS_ES, WORDS_EN
+        from ..wordlists import get_wordlist
         
-        wordlist = WORDS_ES if language.lower() == 'es' else WORDS_EN
-        selected_words = [secrets.choice(wordlist) for _ in range(words)]
+        wordlist = get_wordlist(language)
+        rng = self._sysrand
+        selected_words = rng.choices(wordlist, k=words)
         
         if capitalize:
             selected_words = [word.capitalize() for word in selected_words]
@@ -94,15 +180,15 @@ def generate_passphrase(
         passphrase = separator.join(selected_words)
         
         if add_number:
-            number = str(secrets.randbelow(90) + 10)  # 10-99
-            if secrets.randbelow(2):
+            number = str(rng.randrange(10, 100))
+            if rng.getrandbits(1):
                 passphrase = f"{number}{separator}{passphrase}"
             else:
                 passphrase = f"{passphrase}{separator}{number}"
                 
         if add_symbol and self.char_sets['symbols']:
-            symbol = secrets.choice(self.char_sets['symbols'])
-            if secrets.randbelow(2):
+            symbol = rng.choice(self.char_sets['symbols'])
+            if rng.getrandbits(1):
                 passphrase = f"{symbol}{passphrase}"
             else:
                 passphrase = f"{passphrase}{symbol}"
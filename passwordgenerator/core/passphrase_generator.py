@@ -1,7 +1,18 @@
 """Módulo para generar frases de contraseña seguras y fáciles de recordar."""
-import random
+import math
+import secrets
+import string
+import sys
+from collections import deque
+from itertools import islice
 from typing import List, Optional
 
+# Clases de caracteres ASCII para evaluar una frase con un único recorrido
+_UPPER = frozenset(string.ascii_uppercase)
+_LOWER = frozenset(string.ascii_lowercase)
+_DIGITS = frozenset(string.digits)
+_ALNUM = _UPPER | _LOWER | _DIGITS
+
 class PassphraseGenerator:
     """Genera frases de contraseña utilizando palabras comunes."""
     
@@ -20,6 +31,60 @@ class PassphraseGenerator:
     def __init__(self, wordlist: Optional[List[str]] = None):
         """Inicializa el generador con una lista de palabras personalizada o la predeterminada."""
         self.wordlist = wordlist or self.WORDLIST_ES
+        # Generador criptográfico (os.urandom) reutilizado en cada frase
+        self._rng = secrets.SystemRandom()
+    
+    @classmethod
+    def from_stream(
+        cls,
+        path,
+        reservoir_size: int = 8192,
+        rng: Optional[secrets.SystemRandom] = None
+    ) -> 'PassphraseGenerator':
+        """
+        Crea un generador a partir de un archivo de palabras arbitrariamente grande.
+        
+        Recorre el archivo una sola vez y conserva una muestra uniforme de como
+        máximo ``reservoir_size`` palabras (muestreo de reservorio, Algoritmo L),
+        de modo que la memoria no depende del tamaño del archivo. Se ignoran las
+        líneas vacías y de cada línea se toma el último campo, lo que admite
+        listas con formato EFF (``11111<TAB>palabra``).
+        
+        Args:
+            path: Ruta al archivo de palabras (UTF-8, una por línea).
+            reservoir_size: Número máximo de palabras a conservar.
+            rng: Generador aleatorio; por defecto uno criptográfico.
+            
+        Returns:
+            PassphraseGenerator: Generador con las palabras muestreadas.
+        """
+        if reservoir_size < 1:
+            raise ValueError("El tamaño del reservorio debe ser al menos 1")
+        rng = rng or secrets.SystemRandom()
+        
+        def log_random() -> float:
+            # random() puede devolver 0.0, cuyo logaritmo no está definido
+            return math.log(rng.random() or sys.float_info.min)
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = filter(None, map(str.strip, f))
+            reservoir = [line.split()[-1] for line in islice(lines, reservoir_size)]
+            if not reservoir:
+                raise ValueError(f"El archivo {path} no contiene palabras")
+            
+            if len(reservoir) == reservoir_size:
+                w = math.exp(log_random() / reservoir_size)
+                while True:
+                    # Descartar de golpe las líneas que no entran en la muestra
+                    skip = math.floor(log_random() / math.log1p(-w))
+                    deque(islice(lines, skip), maxlen=0)
+                    line = next(lines, None)
+                    if line is None:
+                        break
+                    reservoir[rng.randrange(reservoir_size)] = line.split()[-1]
+                    w *= math.exp(log_random() / reservoir_size)
+        
+        return cls(reservoir)
     
     def generate(self, 
                 num_words: int = 4, 
@@ -44,7 +109,7 @@ def generate(self,
         num_words = max(2, min(8, num_words))
         
         # Seleccionar palabras aleatorias
-        words = random.sample(self.wordlist, num_words)
+        words = self._rng.sample(self.wordlist, num_words)
         
         # Aplicar formato a las palabras
         if capitalize:
@@ -55,12 +120,12 @@ def generate(self,
         
         # Añadir un número si se solicita
         if add_number:
-            passphrase += str(random.randint(0, 999))
+            passphrase += str(self._rng.randrange(1000))
         
         # Añadir un símbolo si se solicita
         if add_symbol and add_number:
             symbols = '!@#$%^&*()_+-=[]{}|;:,.<>?'
-            passphrase += random.choice(symbols)
+            passphrase += self._rng.choice(symbols)
         
         return passphrase
     
@@ -75,10 +140,18 @@ def estimate_strength(self, passphrase: str) -> str:
             str: Un mensaje que describe la fortaleza de la contraseña.
         """
         length = len(passphrase)
-        has_upper = any(c.isupper() for c in passphrase)
-        has_lower = any(c.islower() for c in passphrase)
-        has_digit = any(c.isdigit() for c in passphrase)
-        has_symbol = any(not c.isalnum() for c in passphrase)
+        chars = set(passphrase)
+        if passphrase.isascii():
+            has_upper = not _UPPER.isdisjoint(chars)
+            has_lower = not _LOWER.isdisjoint(chars)
+            has_digit = not _DIGITS.isdisjoint(chars)
+            has_symbol = not chars <= _ALNUM
+        else:
+            # Fuera de ASCII se conservan las reglas Unicode de str
+            has_upper = any(c.isupper() for c in chars)
+            has_lower = any(c.islower() for c in chars)
+            has_digit = any(c.isdigit() for c in chars)
+            has_symbol = any(not c.isalnum() for c in chars)
         
         if length < 12:
             return "Muy débil - Demasiado corta"
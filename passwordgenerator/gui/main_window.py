@@ -1,11 +1,13 @@
 """Módulo principal de la interfaz gráfica del generador de contraseñas."""
 import tkinter as tk
 from tkinter import ttk, messagebox
-import pyperclip
 from ..core.generator import PasswordGenerator
 from ..core.passphrase_generator import PassphraseGenerator
 from ..security.strength import PasswordStrengthChecker
 
+# Espera (ms) antes de aplicar actualizaciones que se agrupan
+UPDATE_DELAY_MS = 30
+
 class PasswordGeneratorApp:
     """Clase principal de la aplicación de generador de contraseñas."""
     
@@ -49,6 +51,11 @@ def __init__(self, root):
         # Inicializar generador de frases
         self.passphrase_gen = PassphraseGenerator()
         
+        # Actualizaciones diferidas pendientes (identificadores de after)
+        self._length_pending = None
+        self._strength_pending = None
+        self._strength_password = None
+        
         self._create_widgets()
     
     def _setup_styles(self):
@@ -215,7 +222,20 @@ def _create_password_tab(self):
         generate_btn.pack(pady=(10, 0))
     
     def update_length_display(self):
+        """
+        Programa la actualización de la longitud mostrada. Al arrastrar el
+        control deslizante llegan muchos eventos seguidos; solo se aplica el
+        último tras una breve pausa.
+        """
+        if self._length_pending is not None:
+            self.root.after_cancel(self._length_pending)
+        self._length_pending = self.root.after(
+            UPDATE_DELAY_MS, self._apply_length_display
+        )
+    
+    def _apply_length_display(self):
         """Actualiza la visualización de la longitud de la contraseña."""
+        self._length_pending = None
         self.length_display.config(text=str(self.length_var.get()))
     
     def generate_password(self):
@@ -259,7 +279,23 @@ def generate_password(self):
             messagebox.showerror("Error", str(e))
     
     def update_strength_indicator(self, password):
+        """
+        Programa la actualización del indicador de fortaleza. Si llegan varias
+        contraseñas seguidas solo se evalúa la última.
+        """
+        self._strength_password = password
+        if self._strength_pending is not None:
+            self.root.after_cancel(self._strength_pending)
+        self._strength_pending = self.root.after(
+            UPDATE_DELAY_MS, self._apply_strength_indicator
+        )
+    
+    def _apply_strength_indicator(self):
         """Actualiza el indicador de fortaleza de la contraseña."""
+        self._strength_pending = None
+        password, self._strength_password = self._strength_password, None
+        if password is None:
+            return
         strength = self.strength_checker.check_strength(password)
         strength_text = f"Fuerza: {strength.name}"
         self.strength_var.set(strength_text)
@@ -390,7 +426,9 @@ def copy_to_clipboard(self, text_var, message):
         """Copia el texto al portapapeles."""
         text = text_var.get()
         if text:
-            pyperclip.copy(text)
+            # Portapapeles propio de Tk: sin procesos externos (xclip/xsel)
+            self.root.clipboard_clear()
+            self.root.clipboard_append(text)
             messagebox.showinfo("Copiado", message)
         else:
             messagebox.showwarning("Advertencia", "No hay texto para copiar.")
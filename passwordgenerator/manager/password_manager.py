@@ -3,7 +3,9 @@
 Proporciona funcionalidades para almacenar, recuperar y gestionar contraseñas de forma segura.
 """
 import os
+import re
 import json
+import secrets
 import uuid
 import base64
 import hashlib
@@ -22,6 +24,30 @@
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Clases de caracteres ASCII; para texto ASCII equivalen a islower/isupper/
+# isdigit/not isalnum, pero se evalúan en C y se detienen en la primera coincidencia
+_RE_LOWER = re.compile(r'[a-z]')
+_RE_UPPER = re.compile(r'[A-Z]')
+_RE_DIGIT = re.compile(r'[0-9]')
+_RE_SPECIAL = re.compile(r'[^A-Za-z0-9]')
+
+def _urandom_indices(n: int, count: int) -> List[int]:
+    """
+    Devuelve `count` índices uniformes en [0, n) obtenidos de un único bloque
+    de os.urandom mediante muestreo por rechazo.
+    """
+    if n > 256:
+        return [secrets.randbelow(n) for _ in range(count)]
+    mask = (1 << (n - 1).bit_length()) - 1
+    indices: List[int] = []
+    while len(indices) < count:
+        for b in os.urandom((count - len(indices)) * 2):
+            if b & mask < n:
+                indices.append(b & mask)
+                if len(indices) == count:
+                    break
+    return indices
+
 class PasswordManager:
     """
     Gestor de contraseñas con cifrado seguro.
@@ -394,25 +420,30 @@ def get_password_strength(self, password: str) -> PasswordStrength:
         if length >= 16:
             score += 1
             
+        # Tipos de caracteres presentes (se calculan una sola vez)
+        if password.isascii():
+            has_lower = _RE_LOWER.search(password) is not None
+            has_upper = _RE_UPPER.search(password) is not None
+            has_digit = _RE_DIGIT.search(password) is not None
+            has_special = _RE_SPECIAL.search(password) is not None
+        else:
+            has_lower = any(c.islower() for c in password)
+            has_upper = any(c.isupper() for c in password)
+            has_digit = any(c.isdigit() for c in password)
+            has_special = any(not c.isalnum() for c in password)
+        
         # Puntos por complejidad
-        if any(c.islower() for c in password):
-            score += 1
-        if any(c.isupper() for c in password):
-            score += 1
-        if any(c.isdigit() for c in password):
-            score += 1
-        if any(not c.isalnum() for c in password):
-            score += 1
+        score += has_lower + has_upper + has_digit + has_special
             
         # Puntos por entropía (simplificado)
         char_set = 0
-        if any(c.islower() for c in password):
+        if has_lower:
             char_set += 26
-        if any(c.isupper() for c in password):
+        if has_upper:
             char_set += 26
-        if any(c.isdigit() for c in password):
+        if has_digit:
             char_set += 10
-        if any(not c.isalnum() for c in password):
+        if has_special:
             char_set += 32  # Caracteres especiales comunes
             
         entropy = length * (char_set ** 0.5)
@@ -445,7 +476,6 @@ def generate_password(self, length: int = 16, **kwargs) -> str:
         Returns:
             str: Contraseña generada.
         """
-        import random
         import string
         
         # Configurar conjuntos de caracteres
@@ -473,24 +503,30 @@ def generate_password(self, length: int = 16, **kwargs) -> str:
         if not chars:
             chars = string.ascii_letters + string.digits + '!@#$%^&*_+='
         
-        # Generar contraseña
-        password = []
-        
-        # Asegurar al menos un carácter de cada tipo seleccionado
-        if kwargs.get('use_lower', True) and string.ascii_lowercase:
-            password.append(random.choice(string.ascii_lowercase))
-        if kwargs.get('use_upper', True) and string.ascii_uppercase:
-            password.append(random.choice(string.ascii_uppercase))
-        if kwargs.get('use_digits', True) and string.digits:
-            password.append(random.choice(string.digits))
-        if kwargs.get('use_symbols', True) and '!@#$%^&*_+=':
-            password.append(random.choice('!@#$%^&*_+='))
-        
-        # Completar el resto de la contraseña
-        remaining_length = max(0, length - len(password))
-        password.extend(random.choices(chars, k=remaining_length))
-        
-        # Mezclar los caracteres
-        random.shuffle(password)
+        # Conjuntos de los que debe aparecer al menos un carácter
+        required = []
+        if kwargs.get('use_lower', True):
+            required.append(string.ascii_lowercase)
+        if kwargs.get('use_upper', True):
+            required.append(string.ascii_uppercase)
+        if kwargs.get('use_digits', True):
+            required.append(string.digits)
+        if kwargs.get('use_symbols', True):
+            required.append('!@#$%^&*_+=')
+        required = required[:length]
+        
+        # Generar la contraseña completa con un único bloque de os.urandom
+        password = [chars[i] for i in _urandom_indices(len(chars), length)]
+        
+        # Colocar un carácter de cada tipo obligatorio en posiciones distintas
+        positions: List[int] = []
+        while len(positions) < len(required):
+            for pos in _urandom_indices(length, 2 * len(required)):
+                if pos not in positions:
+                    positions.append(pos)
+                    if len(positions) == len(required):
+                        break
+        for pos, char_set in zip(positions, required):
+            password[pos] = char_set[_urandom_indices(len(char_set), 1)[0]]
         
         return ''.join(password)
@@ -28,6 +28,22 @@ class PasswordEntry:
     is_compromised: bool = False
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self):
+        # Cached (service, normalized service); not a field, so it is not serialized
+        self._service_key_cache = ('', '')
+
+    @property
+    def service_key(self) -> str:
+        """
+        Case-insensitive (casefolded) service name, recomputed only when the
+        service changes.
+        """
+        service, key = self._service_key_cache
+        if service != self.service:
+            key = self.service.casefold()
+            self._service_key_cache = (self.service, key)
+        return key
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert the entry to a dictionary."""
         return {
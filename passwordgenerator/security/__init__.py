@@ -8,15 +8,13 @@
 """
 
 from .strength import (
-    calculate_entropy,
-    check_common_passwords,
-    get_password_strength,
-    PasswordStrength
+    PasswordStrength,
+    PasswordStrengthChecker,
+    validate_password_policy
 )
 
 __all__ = [
-    'calculate_entropy',
-    'check_common_passwords',
-    'get_password_strength',
-    'PasswordStrength'
+    'PasswordStrength',
+    'PasswordStrengthChecker',
+    'validate_password_policy'
 ]
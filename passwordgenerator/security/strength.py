@@ -23,6 +23,8 @@ class PasswordStrengthChecker:
         '111111', '2000', 'jordan', 'superman', 'harley', '1234567',
         'iloveyou', 'sunshine', 'princess', 'admin', 'welcome', '123123'
     }
+    # Passwords longer than this cannot be common, so the lookup is skipped
+    COMMON_MAX_LENGTH = max(map(len, COMMON_PASSWORDS))
     
     def __init__(self, min_length: int = 8, require_upper: bool = True,
                  require_digit: bool = True, require_symbol: bool = True):
@@ -57,7 +59,8 @@ def check_strength(self, password: str) -> Tuple[PasswordStrength, Dict[str, Any
         has_digit = any(c.isdigit() for c in password)
         has_symbol = any(not c.isalnum() for c in password)
         length = len(password)
-        is_common = password.lower() in self.COMMON_PASSWORDS
+        is_common = (length <= self.COMMON_MAX_LENGTH
+                     and password.lower() in self.COMMON_PASSWORDS)
         entropy = self._calculate_entropy(password)
         
         # Calculate score (0-100)
@@ -176,7 +179,7 @@ def _has_sequential_chars(self, password: str, min_seq: int = 3) -> bool:
         return False
     
     def _has_repeated_chars(self, password: str, max_repeat: int = 2) -> bool:
-        ""Check for too many repeated characters."""
+        """Check for too many repeated characters."""
         if not password:
             return False
             
@@ -194,7 +197,7 @@ def _has_repeated_chars(self, password: str, max_repeat: int = 2) -> bool:
         return False
     
     def _get_details(self, score: int, details: Dict[str, Any]) -> Dict[str, Any]:
-        ""Format the details dictionary with additional information."""
+        """Format the details dictionary with additional information."""
         return {
             'score': score,
             'length': details['length'],
@@ -209,7 +212,7 @@ def _get_details(self, score: int, details: Dict[str, Any]) -> Dict[str, Any]:
         }
     
     def _get_suggestions(self, details: Dict[str, Any]) -> List[str]:
-        ""Generate suggestions for improving password strength."""
+        """Generate suggestions for improving password strength."""
         suggestions = []
         
         if details['length'] < self.min_length:
@@ -200,6 +200,10 @@ def get_password(self, service: str) -> Optional[PasswordEntry]:
         """Get a password entry by service name."""
         return self._passwords.get(service.lower())
     
+    def list_passwords(self) -> List[PasswordEntry]:
+        """Get all password entries, straight from the in-memory cache."""
+        return list(self._passwords.values())
+    
     def delete_password(self, service: str) -> bool:
         """Delete a password entry."""
         service_lower = service.lower()
@@ -229,7 +233,7 @@ def search_passwords(
             return []
         
         search_fields = search_fields or ['service', 'username']
-        query = query.lower()
+        query = query.casefold()
         
         results = []
         
@@ -248,13 +252,14 @@ def search_passwords(
                 value = ''
                 
                 if field == 'service' and entry.service:
-                    value = entry.service.lower()
+                    value = entry.service_key
                 elif field == 'username' and entry.username:
-                    value = entry.username.lower()
+                    value = entry.username.casefold()
                 elif field == 'notes' and entry.notes:
-                    value = entry.notes.lower()
+                    value = entry.notes.casefold()
                 elif field == 'all':
-                    value = f"{entry.service or ''} {entry.username or ''} {entry.notes or ''}".lower()
+                    value = (f"{entry.service or ''} {entry.username or ''} "
+                             f"{entry.notes or ''}").casefold()
                 
                 if query in value:
                     results.append(entry)
@@ -0,0 +1,31 @@
+"""Word lists for passphrase generation, loaded only when a passphrase is generated."""
+from typing import Tuple
+
+# Default word lists for passphrase generation
+WORDS_ES = (
+    'casa', 'perro', 'gato', 'arbol', 'flor', 'sol', 'luna', 'estrella', 'agua',
+    'fuego', 'tierra', 'aire', 'libro', 'lapiz', 'mesa', 'silla', 'ventana', 'puerta',
+    'cielo', 'mar', 'rio', 'montaña', 'nube', 'lluvia', 'viento', 'naturaleza',
+    'jardin', 'parque', 'calle', 'ciudad', 'pueblo', 'pais', 'mundo', 'universo',
+    'galaxia', 'planeta', 'satelite', 'cometa', 'meteorito', 'estacion', 'primavera',
+    'verano', 'otono', 'invierno', 'manzana', 'naranja', 'platano', 'uva', 'fresa',
+    'cereza'
+)
+
+WORDS_EN = (
+    'apple', 'banana', 'cherry', 'dog', 'cat', 'house', 'tree', 'flower', 'sun', 'moon',
+    'star', 'water', 'fire', 'earth', 'air', 'book', 'pencil', 'table', 'chair',
+    'window', 'door', 'sky', 'sea', 'river', 'mountain', 'cloud', 'rain', 'wind',
+    'nature', 'garden', 'park', 'street', 'city', 'town', 'country', 'world',
+    'universe', 'galaxy', 'planet', 'satellite', 'comet', 'meteor', 'season', 'spring',
+    'summer', 'autumn', 'winter', 'orange', 'grape', 'strawberry'
+)
+
+_WORDLISTS = {'es': WORDS_ES, 'en': WORDS_EN}
+
+def get_wordlist(language: str) -> Tuple[str, ...]:
+    """
+    Return the word list for `language` ('es' or 'en'; anything else falls back
+    to English).
+    """
+    return _WORDLISTS.get(language.lower(), WORDS_EN)
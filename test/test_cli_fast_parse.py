@@ -0,0 +1,90 @@
+"""
+Pruebas unitarias del análisis rápido de argumentos de la línea de comandos.
+"""
+import contextlib
+import io
+import unittest
+
+from passwordgenerator.clit.main import (
+    PasswordCLI,
+    _fast_parse_check,
+    _fast_parse_generate,
+)
+
+
+def _argparse(args):
+    """Analiza `args` con el parser argparse de la CLI."""
+    return PasswordCLI._get_parser(args[0]).parse_args(args)
+
+
+class TestFastParseGenerate(unittest.TestCase):
+    """El análisis rápido de 'generate' debe coincidir con argparse."""
+
+    # Líneas de comandos que el análisis rápido resuelve por sí mismo
+    SUPPORTED = [
+        ['generate'],
+        ['generate', '-l', '24'],
+        ['generate', '--length', '8', '--no-symbols'],
+        ['generate', '--no-upper', '--no-lower', '--no-digits'],
+        ['generate', '--brackets', '--punctuation', '--math', '--space'],
+        ['generate', '-c', '--copy'],
+        ['generate', '-s', 'github', '-u', 'bob'],
+        ['generate', '--save', 'mail', '--username', 'ana@example.com'],
+        ['generate', '--chars', 'lower,digits'],
+        ['generate', '--chars', 'upper, lower', '--extra', 'math,space'],
+        ['generate', '-l', '12', '-l', '20'],
+    ]
+
+    # Líneas de comandos que se dejan a argparse
+    DEFERRED = [
+        ['generate', '--length=20'],
+        ['generate', '--len', '20'],
+        ['generate', '-l'],
+        ['generate', '-l', 'abc'],
+        ['generate', '-s', '-u'],
+        ['generate', '--chars', 'bogus'],
+        ['generate', '-h'],
+        ['generate', 'extra'],
+    ]
+
+    def test_matches_argparse(self):
+        """Prueba que el Namespace sea idéntico al que produce argparse."""
+        for args in self.SUPPORTED:
+            with self.subTest(args=args):
+                fast = _fast_parse_generate(args)
+                self.assertIsNotNone(fast)
+                self.assertEqual(vars(fast), vars(_argparse(args)))
+
+    def test_defers_to_argparse(self):
+        """Prueba que lo que no reconoce se deje a argparse."""
+        for args in self.DEFERRED:
+            with self.subTest(args=args):
+                self.assertIsNone(_fast_parse_generate(args))
+
+    def test_invalid_class_still_reported(self):
+        """Prueba que argparse siga informando de clases desconocidas."""
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            with self.assertRaises(SystemExit):
+                _argparse(['generate', '--chars', 'bogus'])
+        self.assertIn('unknown character class', err.getvalue())
+
+
+class TestFastParseCheck(unittest.TestCase):
+    """El análisis rápido de 'check' debe coincidir con argparse."""
+
+    def test_matches_argparse(self):
+        """Prueba con y sin contraseña."""
+        for args in (['check'], ['check', 'Hola123!']):
+            with self.subTest(args=args):
+                self.assertEqual(vars(_fast_parse_check(args)),
+                                 vars(_argparse(args)))
+
+    def test_defers_to_argparse(self):
+        """Prueba que las opciones y argumentos de más se dejen a argparse."""
+        for args in (['check', '-h'], ['check', 'a', 'b']):
+            with self.subTest(args=args):
+                self.assertIsNone(_fast_parse_check(args))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,276 @@
+"""
+Pruebas unitarias del script passwordgenerator.py (gestor con registro de
+operaciones, filtro de Bloom e importación/exportación).
+"""
+import contextlib
+import copy
+import gc
+import io
+import importlib.machinery
+import importlib.util
+import os
+import pickle
+import stat
+import sys
+import tempfile
+import unittest
+import weakref
+from pathlib import Path
+from unittest import mock
+
+# El script comparte nombre con el paquete passwordgenerator/, así que se carga
+# desde su ruta; se registra en sys.modules para que pickle lo encuentre
+_SCRIPT = Path(__file__).resolve().parent.parent / 'passwordgenerator.py'
+_loader = importlib.machinery.SourceFileLoader('passwordgenerator_script', str(_SCRIPT))
+pg = importlib.util.module_from_spec(
+    importlib.machinery.ModuleSpec(_loader.name, _loader, origin=str(_SCRIPT))
+)
+sys.modules[_loader.name] = pg
+_loader.exec_module(pg)
+
+
+class TestPasswordEntrySlots(unittest.TestCase):
+    """PasswordEntry usa __slots__ mediante _with_slots."""
+
+    def setUp(self):
+        """Crea una entrada con la caché de created_at ya calculada."""
+        self.entry = pg.PasswordEntry(
+            'github', 'Xy12!abcdEFG', 'bob', tags=['dev'],
+            strength=pg.PasswordStrength.STRONG
+        )
+        self.entry.created_at_dt
+
+    def test_no_instance_dict(self):
+        """Prueba que las instancias no lleven __dict__."""
+        self.assertFalse(hasattr(self.entry, '__dict__'))
+
+    def test_pickle_all_protocols(self):
+        """Prueba que la entrada se serialice con cualquier protocolo de pickle."""
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                restored = pickle.loads(pickle.dumps(self.entry, protocol))
+                self.assertEqual(restored, self.entry)
+                self.assertEqual(restored._created_at_cache,
+                                 self.entry._created_at_cache)
+
+    def test_copy(self):
+        """Prueba copy y deepcopy."""
+        self.assertEqual(copy.copy(self.entry), self.entry)
+        clone = copy.deepcopy(self.entry)
+        self.assertEqual(clone, self.entry)
+        self.assertIsNot(clone.tags, self.entry.tags)
+
+
+class _VaultTestCase(unittest.TestCase):
+    """Base para pruebas que usan un directorio de datos temporal."""
+
+    def setUp(self):
+        """Crea el directorio de datos y aísla la red y el usuario del sistema."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.data_dir = Path(self._tmp.name)
+        patches = [
+            mock.patch.object(pg.PasswordGenerator, '_check_if_compromised',
+                              return_value=False),
+            mock.patch.object(pg.PasswordGenerator, '_check_compromised_passwords'),
+            mock.patch.object(pg.os, 'getlogin', return_value='tester',
+                              create=True),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def open_vault(self):
+        """Abre el gestor sobre el directorio de datos temporal."""
+        return pg.PasswordGenerator(self.data_dir)
+
+
+class TestWriteAheadLog(_VaultTestCase):
+    """Registro de operaciones (passwords.wal) y su reaplicación."""
+
+    def save_versions(self, vault, count):
+        """Guarda `count` versiones sucesivas de la contraseña de 'svc'."""
+        for i in range(count):
+            self.assertTrue(vault.save_password('Svc', f'Secret{i}!xyzABC', 'bob'))
+
+    def test_replay_after_crash(self):
+        """Prueba que un gestor nuevo recupere lo que solo está en el registro."""
+        vault = self.open_vault()
+        self.save_versions(vault, 7)
+        self.assertTrue(vault.wal_file.exists())
+
+        # Sin save_passwords: el segundo gestor solo cuenta con el registro
+        replayed = self.open_vault()
+        self.assertEqual(replayed.passwords['svc'].password, 'Secret6!xyzABC')
+        self.assertEqual(replayed.history['svc'], vault.history['svc'])
+        self.assertEqual(len(replayed.history['svc']), vault.HISTORY_LIMIT)
+
+    def test_records_carry_only_new_history_item(self):
+        """Prueba que cada registro lleve solo la versión que pasó al historial."""
+        vault = self.open_vault()
+        self.save_versions(vault, 3)
+        records = [pg._json_loads(line)
+                   for line in vault.wal_file.read_bytes().splitlines()]
+        self.assertNotIn('history', records[0])
+        self.assertNotIn('history_item', records[0])
+        self.assertEqual([r['history_item']['password'] for r in records[1:]],
+                         ['Secret0!xyzABC', 'Secret1!xyzABC'])
+
+    def test_truncated_record_is_ignored(self):
+        """Prueba que una línea a medias (corte al escribir) no pierda lo anterior."""
+        vault = self.open_vault()
+        self.save_versions(vault, 2)
+        with open(vault.wal_file, 'ab') as f:
+            f.write(b'{"op": "upsert", "service": "other", "ent')
+
+        with mock.patch('sys.stdout'):
+            replayed = self.open_vault()
+        self.assertEqual(replayed.passwords['svc'].password, 'Secret1!xyzABC')
+        self.assertNotIn('other', replayed.passwords)
+
+    def test_compaction_removes_log(self):
+        """Prueba que save_passwords vuelque el registro a JSON y lo elimine."""
+        vault = self.open_vault()
+        self.save_versions(vault, 2)
+        vault.save_passwords()
+        self.assertFalse(vault.wal_file.exists())
+        self.assertEqual(self.open_vault().passwords['svc'].password,
+                         'Secret1!xyzABC')
+
+    def test_exit_hook_compacts_open_vaults(self):
+        """Prueba que el volcado al salir alcance a los gestores aún abiertos."""
+        vault = self.open_vault()
+        self.save_versions(vault, 2)
+        pg._compact_open_vaults()
+        self.assertFalse(vault.wal_file.exists())
+
+    def test_exit_hook_does_not_keep_vaults_alive(self):
+        """Prueba que registrar el volcado al salir no retenga el gestor."""
+        vault = self.open_vault()
+        ref = weakref.ref(vault)
+        del vault
+        gc.collect()
+        self.assertIsNone(ref())
+
+    @unittest.skipIf(os.name == 'nt', 'permisos POSIX')
+    def test_log_is_private(self):
+        """Prueba que el registro se cree con permisos 0600."""
+        vault = self.open_vault()
+        self.save_versions(vault, 1)
+        mode = stat.S_IMODE(os.stat(vault.wal_file).st_mode)
+        self.assertEqual(mode, 0o600)
+
+
+class TestBloomFilter(_VaultTestCase):
+    """Filtro de Bloom de contraseñas comunes y su formato en disco."""
+
+    WORDS = ['password', 'dragon', 'qwerty123', 'contraseña', 'letmein']
+
+    def build(self):
+        """Crea un filtro con WORDS."""
+        bloom = pg._BloomFilter.for_capacity(len(self.WORDS), 1e-6)
+        for word in self.WORDS:
+            bloom.add(word)
+        return bloom
+
+    def test_file_round_trip(self):
+        """Prueba que guardar y cargar conserve parámetros, bits y pertenencia."""
+        bloom = self.build()
+        path = self.data_dir / 'common.bloom'
+        bloom.save(path)
+        loaded = pg._BloomFilter.load(path)
+        self.assertEqual((loaded.num_bits, loaded.num_hashes),
+                         (bloom.num_bits, bloom.num_hashes))
+        self.assertEqual(loaded.bits, bloom.bits)
+        for word in self.WORDS:
+            self.assertIn(word, loaded)
+        self.assertNotIn('Zk8#vQ2!mW9p', loaded)
+
+    def test_rejects_invalid_files(self):
+        """Prueba que un archivo ajeno o truncado se rechace."""
+        path = self.data_dir / 'common.bloom'
+        self.build().save(path)
+        data = path.read_bytes()
+        cases = {
+            'magic': b'NOTBLOOM' + data[8:],
+            'truncated': data[:-1],
+            'header': data[:5],
+        }
+        for name, content in cases.items():
+            with self.subTest(name):
+                path.write_bytes(content)
+                with self.assertRaises((ValueError, pg.struct.error)):
+                    pg._BloomFilter.load(path)
+
+    def test_vault_uses_saved_filter(self):
+        """Prueba que otro gestor cargue el filtro construido desde una lista."""
+        wordlist = self.data_dir / 'wordlist.txt'
+        wordlist.write_text('\n'.join(['Password'] + self.WORDS[1:]) + '\n',
+                            encoding='utf-8')
+        built = self.open_vault().build_common_password_filter(str(wordlist))
+        self.assertEqual(built, len(self.WORDS))
+
+        vault = self.open_vault()
+        self.assertTrue(vault._is_common_password('Qwerty123'))
+        self.assertTrue(vault._is_common_password('contraseña'))
+        self.assertFalse(vault._is_common_password('Zk8#vQ2!mW9p'))
+
+
+class TestCsvStrength(_VaultTestCase):
+    """Columna 'strength' de los CSV importados."""
+
+    def import_csv(self, vault, text):
+        """Importa `text` como CSV en `vault`."""
+        path = self.data_dir / 'import.csv'
+        path.write_text(text, encoding='utf-8')
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(vault.import_passwords(str(path), 'csv'))
+
+    def test_foreign_strength_is_recomputed(self):
+        """Prueba que la fortaleza de un CSV ajeno se recalcule."""
+        vault = self.open_vault()
+        self.import_csv(vault, (
+            'service,password,username,strength\n'
+            'bank,123456,bob,EXCELLENT\n'
+            'mail,aaaaaaaa,ana,4\n'
+            'shop,password1,eva,PasswordStrength.EXCELLENT\n'
+        ))
+        for service in ('bank', 'mail', 'shop'):
+            with self.subTest(service):
+                entry = vault.passwords[service]
+                self.assertEqual(entry.strength,
+                                 vault.check_strength(entry.password)[0])
+                self.assertNotEqual(entry.strength, pg.PasswordStrength.EXCELLENT)
+
+    def test_own_export_is_trusted(self):
+        """Prueba que una exportación propia se importe sin recalcular."""
+        vault = self.open_vault()
+        vault.save_password('Bank', 'Xy12!abcdEFG#long', 'bob')
+        vault.save_password('Mail', '123456', 'ana')
+        path = self.data_dir / 'export.csv'
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(vault.export_passwords(str(path), 'csv'))
+
+        other = pg.PasswordGenerator(self.data_dir / 'other')
+        with mock.patch.object(other, 'check_strength_batch',
+                               wraps=other.check_strength_batch) as batch:
+            self.import_csv(other, path.read_text(encoding='utf-8'))
+        batch.assert_called_once_with([])
+        for service in ('bank', 'mail'):
+            with self.subTest(service):
+                self.assertEqual(other.passwords[service].strength,
+                                 vault.passwords[service].strength)
+
+    def test_unknown_label_in_export_is_recomputed(self):
+        """Prueba que con la cabecera de exportación un valor ajeno se recalcule."""
+        vault = self.open_vault()
+        self.import_csv(vault, (
+            ','.join(pg._CSV_EXPORT_HEADER) + '\n'
+            'bank,bob,123456,2024-01-01T00:00:00,2024-01-01T00:00:00,EXCELLENT\n'
+        ))
+        self.assertEqual(vault.passwords['bank'].strength,
+                         vault.check_strength('123456')[0])
+
+
+if __name__ == '__main__':
+    unittest.main()